@@ -0,0 +1,210 @@
+"""
+Construction of the top-level ``aegis`` Typer application.
+
+``aegis.__main__`` stays a thin entry point (so ``aegis version`` can be
+answered without importing Typer); everything that needs Typer — the root
+callback, the lazy command table and plugin mounting — lives here and runs
+only when ``build_app()`` is called.
+"""
+
+from functools import cache
+
+import typer
+
+from ..i18n import detect_locale, set_locale
+from ..i18n.locales import AVAILABLE_LOCALES
+from . import brand
+from .lazy_group import LazyTyperGroup
+
+_HELP = (
+    "Aegis Stack - Production-ready Python foundation\n\n"
+    "Quick start: uvx aegis-stack init my-project\n\n"
+    "Available components: redis, worker, scheduler, scheduler[sqlite], database\n"
+    "Backend selection: Use --backend flag or bracket syntax (sqlite only)"
+)
+_EPILOG = (
+    "Try it instantly: uvx aegis-stack init my-project\n"
+    "More info: https://docs.aegis-stack.io/"
+)
+
+
+def _resolve_locale_callback(value: str | None) -> str | None:
+    """Eager callback: validate + set locale during argument parsing.
+
+    Marked ``is_eager=True`` on the ``--lang`` Option so it runs before
+    typer/click processes ``--help``. That's the whole point: typer
+    short-circuits its main callback on ``--help``, so a non-eager
+    callback would never fire and lazy_t() help strings would render
+    against the default English locale. Eager callbacks fire during
+    argument parsing, before help rendering, with no module-import
+    side effect.
+    """
+    if value:
+        from ..i18n.registry import _normalize_locale
+
+        resolved = _normalize_locale(value)
+        # _normalize_locale falls back to "en" for unknown inputs,
+        # so check if the input actually maps to a real locale.
+        base = value.lower().replace("-", "_").split(".")[0].split("@")[0]
+        if resolved == "en" and not base.startswith("en"):
+            brand.error(
+                f"Unsupported language '{value}'. Available: "
+                f"{', '.join(sorted(AVAILABLE_LOCALES))}",
+                err=True,
+            )
+            raise typer.Exit(1)
+    set_locale(value if value else detect_locale())
+    return value
+
+
+def _version_callback(value: bool) -> None:
+    """Eager callback: print the version and exit, like ``aegis version``.
+
+    ``aegis.__main__`` answers a bare ``aegis --version`` / ``-V`` without
+    importing Typer; this option makes the same flags work when combined
+    with other global options (``aegis --verbose --version``).
+    """
+    if value:
+        from .. import __version__
+        from ..i18n import t
+
+        typer.echo(t("version.info", version=__version__))
+        raise typer.Exit()
+
+
+# Built-in commands, in ``--help`` order: ``name -> "module:attr"``.
+# Nothing here is imported until Click resolves the command (or renders
+# ``--help``), so ``aegis version`` never pays for copier, questionary or the
+# deploy helpers. Keep this the only place a core command is registered.
+LAZY_COMMANDS: dict[str, str] = {
+    "version": "aegis.commands.version:version_command",
+    "components": "aegis.commands.components:components_command",
+    "services": "aegis.commands.services:services_command",
+    "init": "aegis.commands.init:init_command",
+    "add": "aegis.commands.add:add_command",
+    "add-service": "aegis.commands.add_service:add_service_command",
+    "remove": "aegis.commands.remove:remove_command",
+    "remove-service": "aegis.commands.remove_service:remove_service_command",
+    "update": "aegis.commands.update:update_command",
+    # Ingress commands
+    "ingress-enable": "aegis.commands.ingress:ingress_enable_command",
+    # Deploy commands
+    "deploy-init": "aegis.commands.deploy:deploy_init_command",
+    "deploy-setup": "aegis.commands.deploy:deploy_setup_command",
+    "deploy-cd-setup": "aegis.commands.deploy:deploy_cd_setup_command",
+    "deploy": "aegis.commands.deploy:deploy_command",
+    "deploy-backup": "aegis.commands.deploy:deploy_backup_command",
+    "deploy-backups": "aegis.commands.deploy:deploy_backups_command",
+    "deploy-rollback": "aegis.commands.deploy:deploy_rollback_command",
+    "deploy-logs": "aegis.commands.deploy:deploy_logs_command",
+    "deploy-status": "aegis.commands.deploy:deploy_status_command",
+    "deploy-stop": "aegis.commands.deploy:deploy_stop_command",
+    "deploy-restart": "aegis.commands.deploy:deploy_restart_command",
+    "deploy-shell": "aegis.commands.deploy:deploy_shell_command",
+    # Plugin inspection commands (#769). Registered before R5's plugin-defined
+    # sub-apps so its name is "reserved" from the perspective of plugin
+    # discovery (a plugin called "plugins" would collide with this surface).
+    # There is intentionally no ``plugins install``: putting bytes on disk is
+    # ``pip install``; project-configuration is ``aegis add`` (#771).
+    "plugins": "aegis.commands.plugins:plugins_app",
+}
+
+
+class AegisGroup(LazyTyperGroup):
+    """Root Click group for ``aegis``; resolves ``LAZY_COMMANDS`` on demand."""
+
+    lazy_commands = LAZY_COMMANDS
+
+
+_VERBOSE_OPT = typer.Option(
+    False,
+    "--verbose",
+    "-v",
+    help="Enable verbose output (show detailed file operations)",
+)
+
+
+_VERSION_OPT = typer.Option(
+    False,
+    "--version",
+    "-V",
+    help="Show the Aegis Stack CLI version and exit",
+    callback=_version_callback,
+    is_eager=True,
+)
+
+
+def global_options(
+    verbose: bool = _VERBOSE_OPT,
+    version: bool = _VERSION_OPT,
+    lang: str | None = typer.Option(
+        None,
+        "--lang",
+        help="Output language (de, en, es, fr, ja, ko, ru, zh, zh_Hant). Default: auto-detect from AEGIS_LANG or system locale",
+        envvar="AEGIS_LANG",
+        callback=_resolve_locale_callback,
+        is_eager=True,
+    ),
+) -> None:
+    """Aegis Stack CLI - Global options and configuration."""
+    # Verbosity defaults to off in a fresh process; only pay for the import
+    # when the flag is actually passed.
+    if verbose:
+        from ..core.verbosity import set_verbose
+
+        set_verbose(True)
+    # Locale resolution + validation already handled by _resolve_locale_callback
+    # (eager) so that --help paths see the right locale.
+
+
+# R5: mount plugin-provided sub-apps under `aegis <plugin> ...`.
+# Each plugin declares a typer.Typer via the `aegis.plugins.cli` entry
+# point group; see aegis/core/plugin_discovery.py. Discovery is
+# error-tolerant — a malformed plugin warns to stderr and is skipped,
+# so a broken third-party install never breaks the core CLI.
+def reserved_command_names(target_app: typer.Typer) -> set[str]:
+    """Names plugins may not claim: lazy core commands plus anything
+    already registered on ``target_app``."""
+    reserved = set(LAZY_COMMANDS)
+    reserved.update(cmd.name for cmd in target_app.registered_commands if cmd.name)
+    reserved.update(grp.name for grp in target_app.registered_groups if grp.name)
+    return reserved
+
+
+def _mount_plugin_cli_apps(target_app: typer.Typer) -> None:
+    """Discover plugin CLI sub-apps and mount them under ``target_app``.
+
+    Pulled out as a function (taking ``target_app`` rather than calling
+    ``get_app``) so tests can verify the mount path against a fresh Typer
+    instance.
+    """
+    from ..core.plugins.discovery import discover_plugin_cli_apps
+
+    reserved = reserved_command_names(target_app)
+    for plugin_name, sub_app in discover_plugin_cli_apps(reserved).items():
+        target_app.add_typer(sub_app, name=plugin_name)
+
+
+def build_app() -> typer.Typer:
+    """Build a fresh ``aegis`` Typer app with plugin sub-apps mounted."""
+    # Brand the rich ``--help`` output (teal = typeable tokens, neutral = prose,
+    # dim = annotations/chrome). Single source in brand.py; must run before the
+    # Typer app is built so its help panels pick up the styling.
+    brand.apply_help_theme()
+
+    app = typer.Typer(
+        name="aegis",
+        help=_HELP,
+        epilog=_EPILOG,
+        add_completion=False,
+        cls=AegisGroup,
+    )
+    app.callback()(global_options)
+    _mount_plugin_cli_apps(app)
+    return app
+
+
+@cache
+def get_app() -> typer.Typer:
+    """The process-wide ``aegis`` app, built on first use."""
+    return build_app()
@@ -111,30 +111,30 @@ def _split_service_list(value: str) -> list[str]:
         List of service strings with brackets preserved
     """
     services = []
-    current = ""
+    start = 0
     bracket_depth = 0
 
-    for char in value:
+    # Track where the current entry starts and slice it out at each
+    # top-level comma, rather than rebuilding it one character at a time.
+    for index, char in enumerate(value):
         if char == "[":
             bracket_depth += 1
-            current += char
         elif char == "]":
             # Only decrement if we're inside brackets to prevent negative depth
             # from mismatched brackets like "ai],auth"
             if bracket_depth > 0:
                 bracket_depth -= 1
-            current += char
         elif char == "," and bracket_depth == 0:
             # Only split on comma if we're not inside brackets
-            if current.strip():
-                services.append(current.strip())
-            current = ""
-        else:
-            current += char
+            service = value[start:index].strip()
+            if service:
+                services.append(service)
+            start = index + 1
 
     # Don't forget the last service
-    if current.strip():
-        services.append(current.strip())
+    service = value[start:].strip()
+    if service:
+        services.append(service)
 
     return services
 
@@ -197,15 +197,9 @@ def validate_and_resolve_services(
     if hasattr(ctx, "resilient_parsing") and ctx.resilient_parsing is True:
         return None
 
-    # Parse comma-separated string, respecting bracket syntax
-    services_raw = _split_service_list(value)
-
-    # Check for empty services before filtering
-    if any(not s for s in services_raw):
-        brand.error(Messages.EMPTY_SERVICE_NAME, err=True)
-        raise typer.Exit(1)
-
-    selected_services = [s for s in services_raw if s]
+    # Parse comma-separated string, respecting bracket syntax. Empty entries
+    # (e.g. "auth,,ai") are dropped by the splitter itself.
+    selected_services = _split_service_list(value)
 
     # Validate services exist (extract base name to support bracket syntax like ai[langchain, openai])
     unknown_services = [
@@ -6,12 +6,12 @@ used by CLI commands.
 """
 
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
-import questionary
 import typer
 
 from ..constants import (
@@ -31,12 +31,17 @@ from ..core.plugins.spec import PluginSpec
 from ..core.services import (
     SERVICE_TYPE_I18N_KEYS,
     SERVICES,
+    ServiceSpec,
     ServiceType,
-    get_services_by_type,
+    group_services_by_type,
 )
-from ..i18n import t
+from ..i18n import get_locale, t
 from . import brand
 
+# "backend + frontend" for the init header; the surrounding sentence is
+# translated per call, the component list never changes.
+_CORE_COMPONENTS_LABEL = " + ".join(CORE_COMPONENTS)
+
 
 def _translated_desc(name: str, fallback: str) -> str:
     """Get translated description for a component or service, with fallback."""
@@ -49,26 +54,37 @@ def _translated_desc(name: str, fallback: str) -> str:
     return fallback
 
 
-# Global variable to store AI provider selections for template generation
-_ai_provider_selection: dict[str, list[str]] = {}
+@dataclass
+class _AIServiceState:
+    """AI selections for one service instance, read back at generation time.
 
-# Global variable to store AI framework selection for template generation
-_ai_framework_selection: dict[str, str] = {}
+    Defaults are what the getters report for a service that was never
+    configured.
+    """
 
-# Global variable to store AI backend selection for template generation
-_ai_backend_selection: dict[str, str] = {}
+    framework: str = AIFrameworks.PYDANTIC_AI
+    backend: str = StorageBackends.MEMORY
+    providers: list[str] = field(default_factory=lambda: [AIProviders.OPENAI])
+    rag: bool = False
+    voice: bool = False
+    skip_llm_sync: bool = False
+    ollama_mode: str = OllamaMode.NONE
 
-# Global variable to store AI RAG selection for template generation
-_ai_rag_selection: dict[str, bool] = {}
 
-# Global variable to store AI voice selection for template generation
-_ai_voice_selection: dict[str, bool] = {}
+# Global AI selections per service name, for template generation
+_ai_states: dict[str, _AIServiceState] = {}
 
-# Global variable to store skip LLM sync selection for template generation
-_skip_llm_sync_selection: dict[str, bool] = {}
+# Read-only stand-in for services that were never configured
+_DEFAULT_AI_STATE = _AIServiceState()
+
+
+def _ai_state(service_name: str) -> _AIServiceState:
+    """The stored state for ``service_name``, created on first write."""
+    state = _ai_states.get(service_name)
+    if state is None:
+        state = _ai_states[service_name] = _AIServiceState()
+    return state
 
-# Global variable to store Ollama mode selection for template generation
-_ollama_mode_selection: dict[str, str] = {}
 
 # Global variable to store auth level selection for template generation
 _auth_level_selection: dict[str, str] = {}
@@ -101,6 +117,8 @@ def select_database_engine(context: str = "Database") -> str:
 
     typer.echo(f"\n{t('interactive.db_engine_label', context=context)}")
 
+    import questionary
+
     choices = [
         questionary.Choice(
             title=t("interactive.db_sqlite"),
@@ -160,6 +178,8 @@ def select_postgres_provider(context: str = "Database") -> str:
     if _postgres_provider_selection is not None:
         return _postgres_provider_selection
 
+    import questionary
+
     choices = [
         questionary.Choice(
             title=t("interactive.db_provider_container"),
@@ -215,6 +235,8 @@ def select_worker_backend() -> str:
     """
     typer.echo(f"\n{t('interactive.worker_label')}")
 
+    import questionary
+
     choices = [
         questionary.Choice(
             title=t("interactive.worker_arq"),
@@ -288,6 +310,21 @@ class ProjectSelection:
     # (``database[neon]``) for downstream generation.
     postgres_provider: str = PostgresProviders.CONTAINER
     database_added_by_scheduler: bool = False
+    # Base names (bracket suffix stripped) of ``components``, kept in step
+    # by ``add_component`` so membership checks don't rescan the list.
+    component_bases: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        self.component_bases.update(comp.partition("[")[0] for comp in self.components)
+
+    def add_component(self, component: str) -> None:
+        """Append ``component`` (bracket syntax allowed) and index its base."""
+        self.components.append(component)
+        self.component_bases.add(component.partition("[")[0])
+
+    def has_component(self, name: str) -> bool:
+        """True when ``name`` is selected, with or without a bracket variant."""
+        return name in self.component_bases
 
 
 class SelectionUI(Protocol):
@@ -396,7 +433,7 @@ class TyperSelectionUI:
 def _step_worker(spec: ComponentSpec, state: ProjectSelection, ui: SelectionUI) -> None:
     """Worker prompt; bundles redis (hard dependency) when not yet selected."""
     desc = _translated_desc(spec.name, spec.description)
-    redis_selected = ComponentNames.REDIS in state.components
+    redis_selected = state.has_component(ComponentNames.REDIS)
     prompt_key = (
         "interactive.add_prompt" if redis_selected else "interactive.add_with_redis"
     )
@@ -410,9 +447,9 @@ def _step_worker(spec: ComponentSpec, state: ProjectSelection, ui: SelectionUI)
         else f"{ComponentNames.WORKER}[{backend}]"
     )
     if not redis_selected:
-        state.components.append(ComponentNames.REDIS)
+        state.add_component(ComponentNames.REDIS)
         ui.note_auto_added(ComponentNames.REDIS)
-    state.components.append(worker)
+    state.add_component(worker)
     ui.success(t("interactive.worker_configured", backend=backend))
 
 
@@ -431,9 +468,13 @@ def _step_scheduler(
     ):
         return
 
-    state.components.append(ComponentNames.SCHEDULER)
-
     engine = ui.choose_scheduler_backend()
+    # Bracket the backend in at insertion time: memory stays plain.
+    state.add_component(
+        ComponentNames.SCHEDULER
+        if engine == StorageBackends.MEMORY
+        else f"{ComponentNames.SCHEDULER}[{engine}]"
+    )
     if engine != StorageBackends.MEMORY:
         token = engine
         if engine == StorageBackends.POSTGRES:
@@ -445,9 +486,7 @@ def _step_scheduler(
             state.postgres_provider = provider
             if provider == PostgresProviders.NEON:
                 token = PostgresProviders.NEON
-            state.components.append(f"{ComponentNames.DATABASE}[{token}]")
-        else:
-            state.components.append(ComponentNames.DATABASE)
+        state.add_component(f"{ComponentNames.DATABASE}[{token}]")
         state.database_engine = engine
         state.database_added_by_scheduler = True
         state.scheduler_backend = engine
@@ -474,8 +513,6 @@ def _step_database(
     ):
         return
 
-    state.components.append(ComponentNames.DATABASE)
-
     # Engine, then (for postgres) the host: SQLite / PostgreSQL, and when
     # PostgreSQL, a local container vs Neon. Only postgres pins the engine onto
     # state; SQLite stays the implicit default (plain ``database``).
@@ -483,8 +520,18 @@ def _step_database(
     if engine == StorageBackends.POSTGRES:
         state.database_engine = StorageBackends.POSTGRES
         state.postgres_provider = provider or PostgresProviders.CONTAINER
+        # Neon is a postgres provider: encode it as database[neon] so the
+        # generator normalizes it back to engine=postgres + provider=neon.
+        token = (
+            PostgresProviders.NEON
+            if state.postgres_provider == PostgresProviders.NEON
+            else StorageBackends.POSTGRES
+        )
+        state.add_component(f"{ComponentNames.DATABASE}[{token}]")
+    else:
+        state.add_component(ComponentNames.DATABASE)
 
-    if ComponentNames.SCHEDULER in state.components:
+    if state.has_component(ComponentNames.SCHEDULER):
         ui.echo(f"\n{t('interactive.bonus_backup')}")
         ui.success(t("interactive.backup_desc"))
 
@@ -498,11 +545,11 @@ def _step_generic_component(
     bundles redis) — asking again would either duplicate it or read as
     undoing a rule the user just opted into.
     """
-    if any(comp.partition("[")[0] == spec.name for comp in state.components):
+    if state.has_component(spec.name):
         return
     desc = _translated_desc(spec.name, spec.description)
     if ui.confirm(f"  {t('interactive.add_prompt', description=desc)}", context=spec):
-        state.components.append(spec.name)
+        state.add_component(spec.name)
 
 
 ComponentStep = Callable[[ComponentSpec, ProjectSelection, SelectionUI], None]
@@ -526,9 +573,7 @@ def run_project_selection(ui: SelectionUI) -> ProjectSelection:
     state = ProjectSelection()
 
     ui.section(t("interactive.component_selection"))
-    ui.success(
-        t("interactive.core_included", components=" + ".join(CORE_COMPONENTS)) + "\n"
-    )
+    ui.success(t("interactive.core_included", components=_CORE_COMPONENTS_LABEL) + "\n")
     ui.echo(t("interactive.infra_header"))
 
     # Process components in registry order to handle dependencies. Every
@@ -540,29 +585,6 @@ def run_project_selection(ui: SelectionUI) -> ProjectSelection:
         step = _COMPONENT_STEPS.get(component_name, _step_generic_component)
         step(spec, state, ui)
 
-    # Rewrite plain names with engine/backend bracket info for display
-    # and downstream resolution.
-    if ComponentNames.DATABASE in state.components and state.database_engine:
-        db_index = state.components.index(ComponentNames.DATABASE)
-        # Neon is a postgres provider: encode it as database[neon] so the
-        # generator normalizes it back to engine=postgres + provider=neon.
-        if (
-            state.database_engine == StorageBackends.POSTGRES
-            and state.postgres_provider == PostgresProviders.NEON
-        ):
-            token = PostgresProviders.NEON
-        else:
-            token = state.database_engine
-        state.components[db_index] = f"{ComponentNames.DATABASE}[{token}]"
-    if (
-        ComponentNames.SCHEDULER in state.components
-        and state.scheduler_backend != StorageBackends.MEMORY
-    ):
-        scheduler_index = state.components.index(ComponentNames.SCHEDULER)
-        state.components[scheduler_index] = (
-            f"{ComponentNames.SCHEDULER}[{state.scheduler_backend}]"
-        )
-
     # Service selection: every registered service, grouped by type in
     # ServiceType declaration order. Derived from the registry so a new
     # service (or type) is offered automatically — the hand-written
@@ -572,9 +594,13 @@ def run_project_selection(ui: SelectionUI) -> ProjectSelection:
         ui.section(t("interactive.service_selection"), newline_before=True)
         ui.echo(t("interactive.services_intro") + "\n")
         first = True
+        grouped = group_services_by_type()
         for service_type in ServiceType:
-            shown = _step_services_of_type(state, ui, service_type, first=first)
-            first = first and not shown
+            type_services = grouped.get(service_type)
+            if not type_services:
+                continue
+            _step_services_of_type(state, ui, service_type, type_services, first=first)
+            first = False
 
     return state
 
@@ -583,19 +609,16 @@ def _step_services_of_type(
     state: ProjectSelection,
     ui: SelectionUI,
     service_type: ServiceType,
+    type_services: dict[str, ServiceSpec],
     *,
     first: bool,
-) -> bool:
-    """Offer every service of one type. Returns True when any were shown.
+) -> None:
+    """Offer every service of one (non-empty) type group.
 
     Services with extra interactive configuration (auth's level + database
     dance, AI's full setup) run their configurator from
     ``_SERVICE_INIT_CONFIGURATORS``; everything else is confirm-and-add.
     """
-    type_services = get_services_by_type(service_type)
-    if not type_services:
-        return False
-
     header = t(SERVICE_TYPE_I18N_KEYS[service_type])
     ui.echo(header if first else f"\n{header}")
     for service_name, service_spec in type_services.items():
@@ -610,7 +633,6 @@ def _step_services_of_type(
             configure(state, ui, service_name)
         else:
             state.services.append(service_name)
-    return True
 
 
 def _configure_auth_init(
@@ -625,10 +647,8 @@ def _configure_auth_init(
     ui.echo(f"  {t('interactive.auth_db_reason')}")
     ui.echo(f"  {t('interactive.auth_db_details')}")
 
-    # Substring check on purpose: catches "database[postgres]" too.
-    database_already_selected = any(
-        ComponentNames.DATABASE in comp for comp in state.components
-    )
+    # Base-name check: catches "database[postgres]" too.
+    database_already_selected = state.has_component(ComponentNames.DATABASE)
     if database_already_selected:
         ui.success(t("interactive.auth_db_already"))
     elif not ui.confirm(f"  {t('interactive.auth_db_confirm')}"):
@@ -680,9 +700,7 @@ def _configure_ai_init(
 
     # Handle database auto-add for database backends
     if backend in (StorageBackends.SQLITE, StorageBackends.POSTGRES):
-        database_already_selected = any(
-            ComponentNames.DATABASE in comp for comp in state.components
-        )
+        database_already_selected = state.has_component(ComponentNames.DATABASE)
         if database_already_selected:
             ui.success(f"  {t('interactive.ai_db_already')}")
         else:
@@ -694,7 +712,7 @@ def _configure_ai_init(
                 state.postgres_provider = provider
                 if provider == PostgresProviders.NEON:
                     token = PostgresProviders.NEON
-            state.components.append(f"{ComponentNames.DATABASE}[{token}]")
+            state.add_component(f"{ComponentNames.DATABASE}[{token}]")
             # The AI choice just fixed the project's database engine.
             state.database_engine = backend
             ui.note_auto_added(ComponentNames.DATABASE, token)
@@ -751,7 +769,8 @@ def get_ai_provider_selection(service_name: str = "ai") -> list[str]:
     Returns:
         List of selected provider names, or default providers if none selected
     """
-    return _ai_provider_selection.get(service_name, [AIProviders.OPENAI])
+    state = _ai_states.get(service_name)
+    return state.providers if state is not None else [AIProviders.OPENAI]
 
 
 def get_ai_framework_selection(service_name: str = "ai") -> str:
@@ -764,19 +783,19 @@ def get_ai_framework_selection(service_name: str = "ai") -> str:
     Returns:
         Selected framework name, or default (pydantic-ai) if none selected
     """
-    return _ai_framework_selection.get(service_name, AIFrameworks.PYDANTIC_AI)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).framework
 
 
 def clear_ai_provider_selection() -> None:
     """Clear stored AI provider selection (useful for testing)."""
-    global _ai_provider_selection
-    _ai_provider_selection.clear()
+    for state in _ai_states.values():
+        state.providers = [AIProviders.OPENAI]
 
 
 def clear_ai_framework_selection() -> None:
     """Clear stored AI framework selection (useful for testing)."""
-    global _ai_framework_selection
-    _ai_framework_selection.clear()
+    for state in _ai_states.values():
+        state.framework = AIFrameworks.PYDANTIC_AI
 
 
 def get_ai_backend_selection(service_name: str = "ai") -> str:
@@ -789,13 +808,13 @@ def get_ai_backend_selection(service_name: str = "ai") -> str:
     Returns:
         Selected backend name, or default (memory) if none selected
     """
-    return _ai_backend_selection.get(service_name, StorageBackends.MEMORY)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).backend
 
 
 def clear_ai_backend_selection() -> None:
     """Clear stored AI backend selection (useful for testing)."""
-    global _ai_backend_selection
-    _ai_backend_selection.clear()
+    for state in _ai_states.values():
+        state.backend = StorageBackends.MEMORY
 
 
 def get_ai_rag_selection(service_name: str = "ai") -> bool:
@@ -808,13 +827,13 @@ def get_ai_rag_selection(service_name: str = "ai") -> bool:
     Returns:
         True if RAG is enabled, False otherwise
     """
-    return _ai_rag_selection.get(service_name, False)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).rag
 
 
 def clear_ai_rag_selection() -> None:
     """Clear stored AI RAG selection (useful for testing)."""
-    global _ai_rag_selection
-    _ai_rag_selection.clear()
+    for state in _ai_states.values():
+        state.rag = False
 
 
 def get_ai_voice_selection(service_name: str = "ai") -> bool:
@@ -827,13 +846,13 @@ def get_ai_voice_selection(service_name: str = "ai") -> bool:
     Returns:
         True if voice is enabled, False otherwise
     """
-    return _ai_voice_selection.get(service_name, False)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).voice
 
 
 def clear_ai_voice_selection() -> None:
     """Clear stored AI voice selection (useful for testing)."""
-    global _ai_voice_selection
-    _ai_voice_selection.clear()
+    for state in _ai_states.values():
+        state.voice = False
 
 
 def get_skip_llm_sync_selection(service_name: str = "ai") -> bool:
@@ -846,13 +865,13 @@ def get_skip_llm_sync_selection(service_name: str = "ai") -> bool:
     Returns:
         True if LLM sync should be skipped, False otherwise
     """
-    return _skip_llm_sync_selection.get(service_name, False)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).skip_llm_sync
 
 
 def clear_skip_llm_sync_selection() -> None:
     """Clear stored skip LLM sync selection (useful for testing)."""
-    global _skip_llm_sync_selection
-    _skip_llm_sync_selection.clear()
+    for state in _ai_states.values():
+        state.skip_llm_sync = False
 
 
 def get_ollama_mode_selection(service_name: str = "ai") -> str:
@@ -865,7 +884,7 @@ def get_ollama_mode_selection(service_name: str = "ai") -> str:
     Returns:
         Selected Ollama mode (host, docker, or none)
     """
-    return _ollama_mode_selection.get(service_name, OllamaMode.NONE)
+    return _ai_states.get(service_name, _DEFAULT_AI_STATE).ollama_mode
 
 
 def set_ollama_mode_selection(service_name: str, mode: str) -> None:
@@ -876,14 +895,13 @@ def set_ollama_mode_selection(service_name: str, mode: str) -> None:
         service_name: Name of the AI service (defaults to "ai")
         mode: Ollama mode (host, docker, or none)
     """
-    global _ollama_mode_selection
-    _ollama_mode_selection[service_name] = mode
+    _ai_state(service_name).ollama_mode = mode
 
 
 def clear_ollama_mode_selection() -> None:
     """Clear stored Ollama mode selection (useful for testing)."""
-    global _ollama_mode_selection
-    _ollama_mode_selection.clear()
+    for state in _ai_states.values():
+        state.ollama_mode = OllamaMode.NONE
 
 
 def set_ai_service_config(
@@ -903,29 +921,21 @@ def set_ai_service_config(
         backend: Storage backend (memory or sqlite)
         providers: List of AI providers
     """
-    global _ai_framework_selection, _ai_backend_selection, _ai_provider_selection
-    global _ollama_mode_selection
-
+    state = _ai_state(service_name)
     if framework is not None:
-        _ai_framework_selection[service_name] = framework
+        state.framework = framework
     if backend is not None:
-        _ai_backend_selection[service_name] = backend
+        state.backend = backend
     if providers is not None:
-        _ai_provider_selection[service_name] = providers
+        state.providers = providers
         # Auto-set ollama_mode to "host" when ollama is a provider (non-interactive default)
         if AIProviders.OLLAMA in providers:
-            _ollama_mode_selection[service_name] = OllamaMode.HOST
+            state.ollama_mode = OllamaMode.HOST
 
 
 def clear_all_ai_selections() -> None:
     """Clear all AI selections (useful for testing)."""
-    clear_ai_provider_selection()
-    clear_ai_framework_selection()
-    clear_ai_backend_selection()
-    clear_ai_rag_selection()
-    clear_ai_voice_selection()
-    clear_skip_llm_sync_selection()
-    clear_ollama_mode_selection()
+    _ai_states.clear()
     clear_database_engine_selection()
     clear_postgres_provider_selection()
     clear_auth_level_selection()
@@ -984,6 +994,8 @@ def interactive_auth_service_config(
 
     typer.echo(f"\n{t('interactive.auth_level_label')}")
 
+    import questionary
+
     choices = [
         questionary.Choice(
             title=t("interactive.auth_basic"),
@@ -1015,6 +1027,27 @@ def interactive_auth_service_config(
     return result
 
 
+@cache
+def _provider_prompts(locale: str) -> tuple[tuple[str, str, bool], ...]:
+    """``(provider_id, prompt, recommended)`` for each AI provider.
+
+    The prompts only depend on the static ``PROVIDER_INFO`` table and the
+    active locale, so they are formatted once per locale.
+    """
+    recommend_text = f" {t('interactive.ai_provider_recommended')}"
+    return tuple(
+        (
+            provider_id,
+            f"    \u2610 {t(f'interactive.ai_provider.{provider_id}')}"
+            f"{recommend_text if recommended else ''}?",
+            recommended,
+        )
+        for provider_id, _name, _description, _pricing, recommended in (
+            AIProviders.PROVIDER_INFO
+        )
+    )
+
+
 def interactive_ai_service_config(
     service_name: str = AnswerKeys.SERVICE_AI,
     existing_engine: str | None = None,
@@ -1034,23 +1067,21 @@ def interactive_ai_service_config(
     Returns:
         Tuple of (backend, framework, providers, rag_enabled)
     """
-    global \
-        _ai_framework_selection, \
-        _ai_backend_selection, \
-        _ai_provider_selection, \
-        _ai_rag_selection
+    state = _ai_state(service_name)
 
     # Framework selection
-    typer.echo(f"\n{t('interactive.ai_framework_label')}")
-    typer.echo(f"  {t('interactive.ai_framework_intro')}")
-    typer.echo(f"    1. {t('interactive.ai_pydanticai')}")
-    typer.echo(f"    2. {t('interactive.ai_langchain')}")
+    typer.echo(
+        f"\n{t('interactive.ai_framework_label')}\n"
+        f"  {t('interactive.ai_framework_intro')}\n"
+        f"    1. {t('interactive.ai_pydanticai')}\n"
+        f"    2. {t('interactive.ai_langchain')}"
+    )
 
     use_pydanticai = typer.confirm(
         f"  {t('interactive.ai_use_pydanticai')}", default=True
     )
     framework = AIFrameworks.PYDANTIC_AI if use_pydanticai else AIFrameworks.LANGCHAIN
-    _ai_framework_selection[service_name] = framework
+    state.framework = framework
     brand.success(f"  {t('interactive.ai_selected_framework', framework=framework)}")
 
     # AI Backend Selection
@@ -1067,49 +1098,40 @@ def interactive_ai_service_config(
     else:
         backend = StorageBackends.MEMORY
 
-    _ai_backend_selection[service_name] = backend
+    state.backend = backend
 
     # LLM catalog sync prompt (only for database backends)
     if backend in (StorageBackends.SQLITE, StorageBackends.POSTGRES):
-        typer.echo(f"\n{t('interactive.ai_sync_label')}")
-        typer.echo(f"  {t('interactive.ai_sync_desc')}")
-        typer.echo(f"  {t('interactive.ai_sync_time')}")
+        typer.echo(
+            f"\n{t('interactive.ai_sync_label')}\n"
+            f"  {t('interactive.ai_sync_desc')}\n"
+            f"  {t('interactive.ai_sync_time')}"
+        )
         skip_sync = not typer.confirm(
             f"  {t('interactive.ai_sync_prompt')}",
             default=True,  # Default to sync
         )
-        _skip_llm_sync_selection[service_name] = skip_sync
+        state.skip_llm_sync = skip_sync
         if not skip_sync:
             brand.success(f"  {t('interactive.ai_sync_will')}")
         else:
             typer.echo(f"  {t('interactive.ai_sync_skipped')}")
 
     # Provider selection
-    typer.echo(f"\n{t('interactive.ai_provider_label')}")
-    typer.echo(f"  {t('interactive.ai_provider_intro')}")
-    typer.echo(f"  {t('interactive.ai_provider_options')}")
+    typer.echo(
+        f"\n{t('interactive.ai_provider_label')}\n"
+        f"  {t('interactive.ai_provider_intro')}\n"
+        f"  {t('interactive.ai_provider_options')}"
+    )
 
     providers: list[str] = []
 
-    # Ask about each provider
-    for (
-        provider_id,
-        _name,
-        _description,
-        _pricing,
-        recommended,
-    ) in AIProviders.PROVIDER_INFO:
-        provider_label = t(f"interactive.ai_provider.{provider_id}")
-        recommend_text = (
-            f" {t('interactive.ai_provider_recommended')}" if recommended else ""
-        )
-        # Opt-in by default: only recommended providers (LLM7.io, which
-        # needs no API key) pre-answer Yes. Enter-through no longer adds
-        # seven providers (and an Ollama install) by accident.
-        if typer.confirm(
-            f"    \u2610 {provider_label}{recommend_text}?",
-            default=recommended,
-        ):
+    # Ask about each provider. Opt-in by default: only recommended
+    # providers (LLM7.io, which needs no API key) pre-answer Yes.
+    # Enter-through no longer adds seven providers (and an Ollama
+    # install) by accident.
+    for provider_id, prompt, recommended in _provider_prompts(get_locale()):
+        if typer.confirm(prompt, default=recommended):
             providers.append(provider_id)
 
     # Handle no providers selected
@@ -1124,21 +1146,23 @@ def interactive_ai_service_config(
     typer.echo(f"  {t('interactive.ai_deps_optimized')}")
 
     # Store provider selection in global context for template generation
-    _ai_provider_selection[service_name] = providers
+    state.providers = providers
 
     # Ollama deployment mode selection (only if Ollama was selected)
     if AIProviders.OLLAMA in providers:
-        typer.echo(f"\n{t('interactive.ai_ollama_label')}")
-        typer.echo(f"  {t('interactive.ai_ollama_intro')}")
-        typer.echo(f"    1. {t('interactive.ai_ollama_host')}")
-        typer.echo(f"    2. {t('interactive.ai_ollama_docker')}")
+        typer.echo(
+            f"\n{t('interactive.ai_ollama_label')}\n"
+            f"  {t('interactive.ai_ollama_intro')}\n"
+            f"    1. {t('interactive.ai_ollama_host')}\n"
+            f"    2. {t('interactive.ai_ollama_docker')}"
+        )
 
         use_host = typer.confirm(
             f"  {t('interactive.ai_ollama_host_prompt')}",
             default=True,
         )
         ollama_mode = OllamaMode.HOST if use_host else OllamaMode.DOCKER
-        _ollama_mode_selection[service_name] = ollama_mode
+        state.ollama_mode = ollama_mode
 
         if ollama_mode == OllamaMode.HOST:
             brand.success(f"  {t('interactive.ai_ollama_host_ok')}")
@@ -1148,7 +1172,7 @@ def interactive_ai_service_config(
             typer.echo(f"  {t('interactive.ai_ollama_docker_hint')}")
     else:
         # No Ollama selected - set mode to none
-        _ollama_mode_selection[service_name] = OllamaMode.NONE
+        state.ollama_mode = OllamaMode.NONE
 
     # RAG selection with Python 3.14 compatibility check
     typer.echo(f"\n{t('interactive.ai_rag_label')}")
@@ -1164,7 +1188,7 @@ def interactive_ai_service_config(
             f"  {t('interactive.ai_rag_prompt')}",
             default=True,
         )
-    _ai_rag_selection[service_name] = rag_enabled
+    state.rag = rag_enabled
     if rag_enabled:
         brand.success(f"  {t('interactive.ai_rag_enabled')}")
 
@@ -1174,13 +1198,115 @@ def interactive_ai_service_config(
         f"  {t('interactive.ai_voice_prompt')}",
         default=True,
     )
-    _ai_voice_selection[service_name] = voice_enabled
+    state.voice = voice_enabled
     if voice_enabled:
         brand.success(f"  {t('interactive.ai_voice_enabled')}")
 
     return backend, framework, providers, rag_enabled, voice_enabled
 
 
+def _load_project_answers(project_path: Path) -> dict[str, Any]:
+    """Load the project's copier answers, exiting with an error if unreadable.
+
+    Shared by the add/remove selection flows. copier_manager is imported
+    here rather than at module level so ``init`` and the other
+    interactive-only paths never load it.
+    """
+    from ..core.copier_manager import load_copier_answers
+
+    try:
+        return load_copier_answers(project_path)
+    except Exception as e:
+        brand.error(f"Failed to load project configuration: {e}", err=True)
+        raise typer.Exit(1)
+
+
+def _enabled_names(answers: dict[str, Any], names: Iterable[str]) -> list[str]:
+    """Entries of ``names`` whose ``include_*`` flag is set, in order."""
+    return [name for name in names if answers.get(AnswerKeys.include_key(name))]
+
+
+# Static header for the add flow's no-database scheduler branch, written
+# in one echo instead of line by line.
+_SCHEDULER_PERSISTENCE_NEEDS_DB = (
+    "\nScheduler Persistence:\n  Job persistence requires SQLite database component"
+)
+
+# Trailer for the remove flows' "nothing to remove" messages.
+_CORE_NOT_REMOVABLE = "   (Core components backend + frontend cannot be removed)"
+
+
+@dataclass
+class _ComponentAddState:
+    """Selection state for ``aegis add`` threaded through the add steps."""
+
+    enabled: set[str]
+    selected: list[str] = field(default_factory=list)
+    scheduler_backend: str = StorageBackends.MEMORY
+
+    def available(self, name: str) -> bool:
+        """True when ``name`` is already in the project or picked this session."""
+        return name in self.enabled or name in self.selected
+
+
+def _add_step_worker(spec: ComponentSpec, state: _ComponentAddState) -> None:
+    """Worker prompt; bundles redis when the project doesn't have it yet."""
+    redis_available = state.available(ComponentNames.REDIS)
+    prompt = f"  Add {spec.description.lower()}?"
+    if not redis_available:
+        prompt += " (will auto-add Redis)"
+    if not typer.confirm(prompt, default=True):
+        return
+
+    backend = select_worker_backend()
+    if not redis_available:
+        state.selected.append(ComponentNames.REDIS)
+    if backend == WorkerBackends.ARQ:
+        state.selected.append(ComponentNames.WORKER)
+    else:
+        state.selected.append(f"{ComponentNames.WORKER}[{backend}]")
+    brand.success(f"Worker with {backend} backend configured")
+
+
+def _add_step_scheduler(spec: ComponentSpec, state: _ComponentAddState) -> None:
+    """Scheduler prompt plus the SQLite persistence question."""
+    if not typer.confirm(f"  Add {spec.description}?", default=True):
+        return
+    state.selected.append(ComponentNames.SCHEDULER)
+
+    if state.available(ComponentNames.DATABASE):
+        # Database already available - offer persistence
+        typer.echo("\nScheduler Persistence:")
+        if typer.confirm("  Enable job persistence with SQLite?", default=True):
+            state.scheduler_backend = StorageBackends.SQLITE
+            brand.success("  Scheduler will use SQLite for job persistence")
+        else:
+            typer.echo("  Scheduler will use memory backend (no persistence)")
+    else:
+        # Ask if they plan to add database
+        typer.echo(_SCHEDULER_PERSISTENCE_NEEDS_DB)
+        if typer.confirm("  Add database component for job persistence?", default=True):
+            state.selected.append(ComponentNames.DATABASE)
+            state.scheduler_backend = StorageBackends.SQLITE
+            brand.success("  Database will be added - scheduler will use SQLite")
+        else:
+            typer.echo("  Scheduler will use memory backend (no persistence)")
+
+
+def _add_step_generic(spec: ComponentSpec, state: _ComponentAddState) -> None:
+    """Plain confirm-and-add for components without special rules."""
+    if typer.confirm(f"  Add {spec.description}?", default=True):
+        state.selected.append(spec.name)
+
+
+# Add-flow counterpart of ``_COMPONENT_STEPS``. Redis needs no entry: when
+# the worker step bundled it, the loop's already-selected skip covers it.
+_COMPONENT_ADD_STEPS: dict[str, Callable[[ComponentSpec, _ComponentAddState], None]] = {
+    ComponentNames.WORKER: _add_step_worker,
+    ComponentNames.SCHEDULER: _add_step_scheduler,
+}
+
+
 def interactive_component_add_selection(project_path: Path) -> tuple[list[str], str]:
     """
     Interactive component selection for adding to existing project.
@@ -1194,24 +1320,17 @@ def interactive_component_add_selection(project_path: Path) -> tuple[list[str],
     Returns:
         Tuple of (selected_components, scheduler_backend)
     """
-    from ..core.copier_manager import load_copier_answers
-
-    # Load current project state
-    try:
-        current_answers = load_copier_answers(project_path)
-    except Exception as e:
-        brand.error(f"Failed to load project configuration: {e}", err=True)
-        raise typer.Exit(1)
+    current_answers = _load_project_answers(project_path)
 
     Messages.print_section_header(
         Messages.SECTION_COMPONENT_SELECTION, newline_before=True
     )
 
     # Show currently enabled components
-    enabled_components = []
-    for component in ComponentNames.INFRASTRUCTURE_ORDER:
-        if current_answers.get(AnswerKeys.include_key(component)):
-            enabled_components.append(component)
+    enabled_components = _enabled_names(
+        current_answers, ComponentNames.INFRASTRUCTURE_ORDER
+    )
+    state = _ComponentAddState(enabled=set(enabled_components))
 
     if enabled_components:
         brand.success(f"Currently enabled: {', '.join(enabled_components)}")
@@ -1220,20 +1339,14 @@ def interactive_component_add_selection(project_path: Path) -> tuple[list[str],
 
     typer.echo("\nAvailable Components:\n")
 
-    selected = []
-    scheduler_backend = StorageBackends.MEMORY
-
-    # Get all infrastructure components in order
-    component_order = ComponentNames.INFRASTRUCTURE_ORDER
-
-    for component_name in component_order:
+    for component_name in ComponentNames.INFRASTRUCTURE_ORDER:
         # Skip if already enabled
-        if component_name in enabled_components:
+        if component_name in state.enabled:
             brand.success(f"  {component_name} - Already enabled")
             continue
 
         # Skip if already selected in this session (e.g., database auto-added by scheduler)
-        if component_name in selected:
+        if component_name in state.selected:
             continue
 
         # Find the component spec
@@ -1241,93 +1354,10 @@ def interactive_component_add_selection(project_path: Path) -> tuple[list[str],
         if not component_spec:
             continue
 
-        # Handle special logic for each component
-        if component_name == ComponentNames.WORKER:
-            if (
-                ComponentNames.REDIS in enabled_components
-                or ComponentNames.REDIS in selected
-            ):
-                # Redis already available
-                prompt = f"  Add {component_spec.description.lower()}?"
-                if typer.confirm(prompt, default=True):
-                    backend = select_worker_backend()
-                    if backend == WorkerBackends.ARQ:
-                        selected.append(ComponentNames.WORKER)
-                    else:
-                        selected.append(f"{ComponentNames.WORKER}[{backend}]")
-                    brand.success(f"Worker with {backend} backend configured")
-            else:
-                # Need to add redis too
-                prompt = (
-                    f"  Add {component_spec.description.lower()}? (will auto-add Redis)"
-                )
-                if typer.confirm(prompt, default=True):
-                    backend = select_worker_backend()
-                    if backend == WorkerBackends.ARQ:
-                        selected.extend([ComponentNames.REDIS, ComponentNames.WORKER])
-                    else:
-                        selected.extend(
-                            [
-                                ComponentNames.REDIS,
-                                f"{ComponentNames.WORKER}[{backend}]",
-                            ]
-                        )
-                    brand.success(f"Worker with {backend} backend configured")
-
-        elif component_name == ComponentNames.SCHEDULER:
-            prompt = f"  Add {component_spec.description}?"
-            if typer.confirm(prompt, default=True):
-                selected.append(ComponentNames.SCHEDULER)
-
-                # Check if database is available or will be added
-                database_available = (
-                    ComponentNames.DATABASE in enabled_components
-                    or ComponentNames.DATABASE in selected
-                )
+        step = _COMPONENT_ADD_STEPS.get(component_name, _add_step_generic)
+        step(component_spec, state)
 
-                if database_available:
-                    # Database already available - offer persistence
-                    typer.echo("\nScheduler Persistence:")
-                    if typer.confirm(
-                        "  Enable job persistence with SQLite?", default=True
-                    ):
-                        scheduler_backend = StorageBackends.SQLITE
-                        brand.success("  Scheduler will use SQLite for job persistence")
-                    else:
-                        typer.echo(
-                            "  Scheduler will use memory backend (no persistence)"
-                        )
-                else:
-                    # Ask if they plan to add database
-                    typer.echo("\nScheduler Persistence:")
-                    typer.echo("  Job persistence requires SQLite database component")
-                    if typer.confirm(
-                        "  Add database component for job persistence?", default=True
-                    ):
-                        selected.append(ComponentNames.DATABASE)
-                        scheduler_backend = StorageBackends.SQLITE
-                        brand.success(
-                            "  Database will be added - scheduler will use SQLite"
-                        )
-                    else:
-                        typer.echo(
-                            "  Scheduler will use memory backend (no persistence)"
-                        )
-
-        elif component_name == ComponentNames.REDIS:
-            # Only offer if not already added by worker
-            if ComponentNames.REDIS not in selected:
-                prompt = f"  Add {component_spec.description}?"
-                if typer.confirm(prompt, default=True):
-                    selected.append(ComponentNames.REDIS)
-
-        else:
-            # Standard prompt for other components
-            prompt = f"  Add {component_spec.description}?"
-            if typer.confirm(prompt, default=True):
-                selected.append(component_name)
-
-    return selected, scheduler_backend
+    return state.selected, state.scheduler_backend
 
 
 def interactive_component_remove_selection(project_path: Path) -> list[str]:
@@ -1343,14 +1373,7 @@ def interactive_component_remove_selection(project_path: Path) -> list[str]:
     Returns:
         List of components to remove
     """
-    from ..core.copier_manager import load_copier_answers
-
-    # Load current project state
-    try:
-        current_answers = load_copier_answers(project_path)
-    except Exception as e:
-        brand.error(f"Failed to load project configuration: {e}", err=True)
-        raise typer.Exit(1)
+    current_answers = _load_project_answers(project_path)
 
     typer.echo()
     brand.warn(Messages.SECTION_COMPONENT_REMOVAL)
@@ -1359,22 +1382,20 @@ def interactive_component_remove_selection(project_path: Path) -> list[str]:
     typer.echo()
 
     # Find enabled components
-    enabled_removable = []
-    for component in ComponentNames.INFRASTRUCTURE_ORDER:
-        if current_answers.get(AnswerKeys.include_key(component)):
-            enabled_removable.append(component)
+    enabled_removable = _enabled_names(
+        current_answers, ComponentNames.INFRASTRUCTURE_ORDER
+    )
 
     if not enabled_removable:
-        typer.echo("No optional components to remove")
-        typer.echo("   (Core components backend + frontend cannot be removed)")
+        typer.echo(f"No optional components to remove\n{_CORE_NOT_REMOVABLE}")
         return []
 
-    typer.echo("Currently enabled components:\n")
-
     # Show core components (not removable)
-    typer.echo("  backend - Core component (cannot remove)")
-    typer.echo("  frontend - Core component (cannot remove)")
-    typer.echo()
+    typer.echo(
+        "Currently enabled components:\n\n"
+        "  backend - Core component (cannot remove)\n"
+        "  frontend - Core component (cannot remove)\n"
+    )
 
     # Show removable components
     selected = []
@@ -1415,14 +1436,7 @@ def interactive_service_selection(project_path: Path) -> list[str]:
     Returns:
         List of services to add
     """
-    from ..core.copier_manager import load_copier_answers
-
-    # Load current project state
-    try:
-        current_answers = load_copier_answers(project_path)
-    except Exception as e:
-        brand.error(f"Failed to load project configuration: {e}", err=True)
-        raise typer.Exit(1)
+    current_answers = _load_project_answers(project_path)
 
     Messages.print_section_header(
         Messages.SECTION_SERVICE_SELECTION, newline_before=True
@@ -1430,16 +1444,13 @@ def interactive_service_selection(project_path: Path) -> list[str]:
     typer.echo("Services provide business logic functionality for your application.\n")
 
     # Find already enabled services
-    enabled_services = []
-    for service_name in SERVICES:
-        if current_answers.get(AnswerKeys.include_key(service_name)):
-            enabled_services.append(service_name)
+    enabled_services = _enabled_names(current_answers, SERVICES)
+    enabled_service_set = set(enabled_services)
 
-    # Find enabled components
-    enabled_components = set(CORE_COMPONENTS)  # Always have core components
-    for component in ComponentNames.INFRASTRUCTURE_ORDER:
-        if current_answers.get(AnswerKeys.include_key(component)):
-            enabled_components.add(component)
+    # Find enabled components (core components are always present)
+    enabled_components = set(CORE_COMPONENTS).union(
+        _enabled_names(current_answers, ComponentNames.INFRASTRUCTURE_ORDER)
+    )
 
     if enabled_services:
         typer.echo("Currently enabled services:")
@@ -1456,8 +1467,9 @@ def interactive_service_selection(project_path: Path) -> list[str]:
     selected_services: list[str] = []
     first_header = True
 
+    grouped = group_services_by_type()
     for service_type in ServiceType:
-        type_services = get_services_by_type(service_type)
+        type_services = grouped.get(service_type)
         if not type_services:
             continue
 
@@ -1468,7 +1480,7 @@ def interactive_service_selection(project_path: Path) -> list[str]:
 
         for service_name, service_spec in type_services.items():
             # Skip if already enabled
-            if service_name in enabled_services:
+            if service_name in enabled_service_set:
                 brand.success(f"  {service_name} - Already enabled")
                 continue
 
@@ -1515,34 +1527,23 @@ def interactive_service_remove_selection(project_path: Path) -> list[str]:
     Returns:
         List of services to remove
     """
-    from ..core.copier_manager import load_copier_answers
-
-    # Load current project state
-    try:
-        current_answers = load_copier_answers(project_path)
-    except Exception as e:
-        brand.error(f"Failed to load project configuration: {e}", err=True)
-        raise typer.Exit(1)
+    current_answers = _load_project_answers(project_path)
 
     Messages.print_section_header(Messages.SECTION_SERVICE_REMOVAL, newline_before=True)
     brand.warn("WARNING: Removing services deletes files permanently!\n")
 
     # Find enabled services
-    enabled_services = []
-    for service_name in SERVICES:
-        if current_answers.get(AnswerKeys.include_key(service_name)):
-            enabled_services.append(service_name)
+    enabled_services = _enabled_names(current_answers, SERVICES)
 
     if not enabled_services:
-        typer.echo("No services are currently enabled.")
-        typer.echo("   (Core components backend + frontend cannot be removed)")
+        typer.echo(f"No services are currently enabled.\n{_CORE_NOT_REMOVABLE}")
         return []
 
-    typer.echo("Currently enabled services:")
-    for service_name in enabled_services:
-        service_spec = SERVICES[service_name]
-        brand.accent(f"  \u2022 {service_name}: {service_spec.description}")
-    typer.echo()
+    listing = "\n".join(
+        brand.accent_text(f"  \u2022 {name}: {SERVICES[name].description}")
+        for name in enabled_services
+    )
+    typer.echo(f"Currently enabled services:\n{listing}\n")
 
     # Ask which to remove
     selected_services = []
@@ -0,0 +1,90 @@
+"""
+Lazy command loading for the top-level ``aegis`` Typer app.
+
+Importing every ``aegis.commands.*`` module up front drags copier,
+questionary/prompt_toolkit and the deploy helpers into every invocation,
+including ``aegis version``. ``LazyTyperGroup`` keeps a table of
+``name -> "module:attr"`` targets and only imports a command's module
+when Click actually resolves that command (or renders it in ``--help``).
+"""
+
+import importlib
+from collections.abc import Mapping
+from difflib import get_close_matches
+from typing import Any, ClassVar
+
+import typer
+
+# typer vendors click as ``typer._click`` and does not re-export UsageError;
+# safe to reach for while typer stays pinned (see pyproject.toml).
+from typer import _click
+from typer._click.exceptions import UsageError
+from typer.core import TyperGroup
+from typer.main import get_command_from_info, get_group_from_info
+from typer.models import CommandInfo, TyperInfo
+
+
+def load_lazy_target(target: str) -> Any:
+    """Import and return the object referenced by a ``"module:attr"`` string."""
+    module_path, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_path), attr)
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that defers importing command modules until first use.
+
+    Subclasses set ``lazy_commands`` to an ordered ``name -> "module:attr"``
+    mapping. A target may be a plain command function or a ``typer.Typer``
+    sub-app; both are converted to Click objects exactly once and cached in
+    ``self.commands``. Eagerly registered commands (e.g. plugin sub-apps
+    mounted via ``add_typer``) keep working untouched.
+    """
+
+    lazy_commands: ClassVar[Mapping[str, str]] = {}
+
+    def list_commands(self, ctx: _click.Context) -> list[str]:
+        """Return lazy command names first, then any eagerly registered ones."""
+        eager = [name for name in self.commands if name not in self.lazy_commands]
+        return [*self.lazy_commands, *eager]
+
+    def get_command(self, ctx: _click.Context, cmd_name: str) -> _click.Command | None:
+        """Resolve ``cmd_name``, importing its module on first access."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.commands[cmd_name] = self._load_command(cmd_name)
+        return self.commands.get(cmd_name)
+
+    def resolve_command(
+        self, ctx: _click.Context, args: list[str]
+    ) -> tuple[str | None, _click.Command | None, list[str]]:
+        """Extend Typer's "did you mean" hints to not-yet-imported commands.
+
+        Typer only suggests names already present in ``self.commands``,
+        which for a lazy group is just whatever has been loaded so far.
+        """
+        try:
+            return super().resolve_command(ctx, args)
+        except UsageError as exc:
+            if args and "Did you mean" not in exc.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    exc.message = (
+                        f"{exc.message.rstrip('.')}. Did you mean {suggestions}?"
+                    )
+            raise
+
+    def _load_command(self, cmd_name: str) -> _click.Command:
+        """Import the lazy target for ``cmd_name`` and build its Click object."""
+        target = load_lazy_target(self.lazy_commands[cmd_name])
+        if isinstance(target, typer.Typer):
+            return get_group_from_info(
+                TyperInfo(target, name=cmd_name),
+                pretty_exceptions_short=True,
+                suggest_commands=self.suggest_commands,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+        return get_command_from_info(
+            CommandInfo(name=cmd_name, callback=target),
+            pretty_exceptions_short=True,
+            rich_markup_mode=self.rich_markup_mode,
+        )
@@ -25,25 +25,33 @@ def detect_scheduler_backend(components: list[str]) -> str:
     Returns:
         Backend name: "memory", "sqlite", or "postgres"
     """
+    # Single pass: note the scheduler's own engine and any database entry.
+    scheduler_seen = False
+    scheduler_engine: str | None = None
+    database_seen = False
+    database_engine: str | None = None
     for component in components:
         base_name = extract_base_component_name(component)
         if base_name == ComponentNames.SCHEDULER:
             engine = extract_engine_info(component)
-            if engine:
-                # Direct scheduler[backend] syntax
-                return engine
-            else:
-                # Check if database is also present (legacy detection)
-                clean_names = clean_component_names(components)
-                if ComponentNames.DATABASE in clean_names:
-                    # Use the database engine if specified, otherwise sqlite
-                    for comp in components:
-                        if extract_base_component_name(comp) == ComponentNames.DATABASE:
-                            db_engine = extract_engine_info(comp)
-                            if db_engine:
-                                return db_engine
-                    return StorageBackends.SQLITE  # Default database backend
-    return StorageBackends.MEMORY  # Default to memory-only
+            if engine and scheduler_engine is None:
+                if not scheduler_seen:
+                    # Direct scheduler[backend] syntax wins outright
+                    return engine
+                scheduler_engine = engine
+            scheduler_seen = True
+        elif base_name == ComponentNames.DATABASE:
+            database_seen = True
+            if database_engine is None:
+                database_engine = extract_engine_info(component)
+
+    if not scheduler_seen:
+        return StorageBackends.MEMORY  # Default to memory-only
+    if database_seen:
+        # Legacy detection: use the database engine if specified, otherwise
+        # the default database backend
+        return database_engine or StorageBackends.SQLITE
+    return scheduler_engine or StorageBackends.MEMORY
 
 
 def detect_worker_backend(components: list[str]) -> str:
@@ -73,25 +81,34 @@ def expand_scheduler_dependencies(components: list[str]) -> list[str]:
         components: List of component names
 
     Returns:
-        Expanded component list with auto-added dependencies
+        Expanded component list with auto-added dependencies. Without a
+        scheduler entry, ``components`` itself is returned (not a copy).
     """
+    if not any(
+        extract_base_component_name(c) == ComponentNames.SCHEDULER for c in components
+    ):
+        return components
+
     result = list(components)  # Copy the list
+    # Base names already present, computed once and kept current as we add.
+    existing_clean = set(clean_component_names(components))
 
     for component in components:
         base_name = extract_base_component_name(component)
         if base_name == ComponentNames.SCHEDULER:
             backend = extract_engine_info(component)
-            if backend and backend != StorageBackends.MEMORY:
-                # Auto-add database with same backend if not already present
-                database_component = f"{ComponentNames.DATABASE}[{backend}]"
-                existing_clean = clean_component_names(result)
-
-                if ComponentNames.DATABASE not in existing_clean:
-                    result.append(database_component)
-                    typer.echo(
-                        f"Auto-added {ComponentNames.DATABASE}[{backend}] for "
-                        f"{ComponentNames.SCHEDULER}[{backend}] persistence"
-                    )
+            # Auto-add database with same backend if not already present
+            if (
+                backend
+                and backend != StorageBackends.MEMORY
+                and ComponentNames.DATABASE not in existing_clean
+            ):
+                result.append(f"{ComponentNames.DATABASE}[{backend}]")
+                existing_clean.add(ComponentNames.DATABASE)
+                typer.echo(
+                    f"Auto-added {ComponentNames.DATABASE}[{backend}] for "
+                    f"{ComponentNames.SCHEDULER}[{backend}] persistence"
+                )
 
     return result
 
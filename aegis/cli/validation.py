@@ -9,7 +9,6 @@ from pathlib import Path
 
 import typer
 
-from ..core.copier_manager import is_copier_project
 from ..i18n import t
 from . import brand
 
@@ -25,9 +24,21 @@ def validate_copier_project(target_path: Path, command_name: str) -> None:
     Raises:
         typer.Exit: If project is not a Copier project
     """
-    if not is_copier_project(target_path):
+    from ..constants import AnswerKeys, Messages
+
+    # A missing answers file is the common failure (wrong directory); answer
+    # it with a stat so that path never pays for importing copier. Otherwise
+    # defer to the canonical check. Deferred: copier_manager pulls in copier
+    # itself, which help rendering and the pure helpers below never need.
+    if (target_path / AnswerKeys.ANSWERS_FILENAME).exists():
+        from ..core.copier_manager import is_copier_project
+
+        is_project = is_copier_project(target_path)
+    else:
+        is_project = False
+
+    if not is_project:
         brand.error(t("shared.not_copier_project", path=target_path), err=True)
-        from ..constants import Messages
 
         typer.echo(
             f"   {Messages.copier_only_command(command_name)}",
@@ -4,13 +4,14 @@ Add service command implementation.
 Adds services (auth, AI, etc.) to an existing Aegis Stack project using Copier's update mechanism.
 """
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 from ..cli import brand
-from ..cli.callbacks import _split_service_list
-from ..cli.utils import detect_scheduler_backend
 from ..cli.validation import (
     validate_copier_project,
     validate_git_repository,
@@ -23,29 +24,22 @@ from ..constants import (
     Messages,
     StorageBackends,
 )
-from ..core.auth_service_parser import (
-    is_auth_service_with_options,
-    parse_auth_service_config,
-)
-from ..core.component_utils import (
-    extract_base_component_name,
-    extract_base_service_name,
-)
-from ..core.components import COMPONENTS, CORE_COMPONENTS
-from ..core.copier_manager import load_copier_answers
-from ..core.manual_updater import ManualUpdater
-from ..core.migration_generator import (
-    MIGRATION_SPECS,
-    bootstrap_alembic,
-    generate_migration,
-    get_services_needing_migrations,
-    service_has_migration,
-)
-from ..core.project_map import render_project_map
-from ..core.service_resolver import ServiceResolver
-from ..core.services import SERVICES, get_service_dependencies
 from ..i18n import lazy_t, t
 
+if TYPE_CHECKING:
+    from ..core.manual_updater import UpdateResult
+
+# Options captured for the ai service (interactive prompt or bracket syntax)
+_AIConfig = dict[str, str | list[str] | bool]
+
+
+@dataclass
+class _ServicePlan:
+    """A service being added: its full spec and the base name it resolves to."""
+
+    full: str
+    base: str
+
 
 def _translated_component_desc(name: str, fallback: str) -> str:
     """Get translated description for a component, with fallback."""
@@ -61,6 +55,158 @@ def _translated_service_desc(name: str, fallback: str) -> str:
     return result if result != key else fallback
 
 
+def _report_add_result(result: "UpdateResult", failure_key: str, **names: str) -> None:
+    """Echo the file counts of one add, or report its failure and exit."""
+    if not result.success:
+        brand.error(t(failure_key, error=result.error_message, **names), err=True)
+        raise typer.Exit(1)
+
+    # Counts go out as one write; lines keep their individual colours.
+    lines: list[str] = []
+    if result.files_modified:
+        lines.append(
+            brand.accent_text(
+                f"   {t('add_service.added_files', count=len(result.files_modified))}"
+            )
+        )
+    if result.files_skipped:
+        lines.append(
+            brand.warn_text(
+                f"   {t('add_service.skipped_files', count=len(result.files_skipped))}"
+            )
+        )
+    if result.files_deleted:
+        lines.append(
+            brand.accent_text(
+                f"   Cleaned {len(result.files_deleted)} empty stub file(s)"
+            )
+        )
+    if result.shared_files_need_manual_merge:
+        lines.append(
+            brand.warn_text(
+                f"   {t('add_service.preserved_files', count=len(result.shared_files_need_manual_merge))}"
+            )
+        )
+    if lines:
+        typer.echo("\n".join(lines))
+
+
+def _component_add_data(component: str) -> dict[str, bool | str]:
+    """Answer data for a component auto-added as a service requirement."""
+    if component == ComponentNames.SCHEDULER:
+        from ..cli.utils import detect_scheduler_backend
+
+        scheduler_backend = detect_scheduler_backend([component])
+        return {
+            AnswerKeys.SCHEDULER_BACKEND: scheduler_backend,
+            AnswerKeys.SCHEDULER_WITH_PERSISTENCE: (
+                scheduler_backend == StorageBackends.SQLITE
+            ),
+        }
+    if component == ComponentNames.DATABASE:
+        return {AnswerKeys.DATABASE_ENGINE: StorageBackends.SQLITE}
+    return {}
+
+
+def _auth_add_data(service: str, ai_config: _AIConfig) -> dict[str, bool | str]:
+    """Auth level flags, when the service spec carries options."""
+    from ..core.auth_service_parser import (
+        is_auth_service_with_options,
+        parse_auth_service_config,
+    )
+
+    if not is_auth_service_with_options(service):
+        return {}
+    level = parse_auth_service_config(service).level
+    return {
+        AnswerKeys.AUTH_LEVEL: level,
+        AnswerKeys.AUTH_RBAC: level in (AuthLevels.RBAC, AuthLevels.ORG),
+        AnswerKeys.AUTH_ORG: level == AuthLevels.ORG,
+    }
+
+
+def _ai_add_data(service: str, ai_config: _AIConfig) -> dict[str, bool | str]:
+    """AI providers, backend and framework from the captured configuration."""
+    service_data: dict[str, bool | str] = {}
+
+    # Use providers from interactive config, or default to openai
+    providers = ai_config.get("providers", [AIProviders.OPENAI])
+    if isinstance(providers, list):
+        service_data[AnswerKeys.AI_PROVIDERS] = ",".join(providers)
+    else:
+        service_data[AnswerKeys.AI_PROVIDERS] = str(providers)
+
+    # Set backend and framework for pyproject.toml regeneration
+    # This ensures alembic is included when sqlite backend is selected
+    backend = ai_config.get("backend", StorageBackends.MEMORY)
+    framework = ai_config.get("framework", "pydantic-ai")
+    # Ensure backend and framework are strings (not lists from ai_config)
+    if isinstance(backend, str):
+        service_data[AnswerKeys.AI_BACKEND] = backend
+    if isinstance(framework, str):
+        service_data[AnswerKeys.AI_FRAMEWORK] = framework
+    return service_data
+
+
+def _insights_add_data(service: str, ai_config: _AIConfig) -> dict[str, bool | str]:
+    """Insights source flags, defaulting to the standard source set."""
+    from ..core.insights_service_parser import (
+        DEFAULT_SOURCES,
+        is_insights_service_with_options,
+        parse_insights_service_config,
+    )
+
+    if is_insights_service_with_options(service):
+        sources = parse_insights_service_config(service).sources
+    else:
+        sources = DEFAULT_SOURCES
+    return {
+        AnswerKeys.INSIGHTS_GITHUB: "github" in sources,
+        AnswerKeys.INSIGHTS_PYPI: "pypi" in sources,
+        AnswerKeys.INSIGHTS_PLAUSIBLE: "plausible" in sources,
+        AnswerKeys.INSIGHTS_REDDIT: "reddit" in sources,
+    }
+
+
+# Per-service answer data passed to the updater, keyed by base service name.
+# Services without an entry are added with no extra data.
+_SERVICE_ADD_DATA: dict[str, Callable[[str, _AIConfig], dict[str, bool | str]]] = {
+    AnswerKeys.SERVICE_AUTH: _auth_add_data,
+    AnswerKeys.SERVICE_AI: _ai_add_data,
+    AnswerKeys.SERVICE_INSIGHTS: _insights_add_data,
+}
+
+
+def _auth_setup_hints(project_slug: str) -> list[str]:
+    """Next steps after adding the auth service."""
+    cmd = typer.style(f"{project_slug} auth create-test-users", bold=True)
+    url = typer.style("http://localhost:8000/docs", bold=True)
+    return [
+        t("add_service.auth_create_users", cmd=cmd),
+        t("add_service.auth_view_routes", url=url),
+    ]
+
+
+def _ai_setup_hints(project_slug: str) -> list[str]:
+    """Next steps after adding the ai service."""
+    provider_var = typer.style("AI_PROVIDER", bold=True)
+    api_key_var = typer.style("OPENAI_API_KEY", bold=True)
+    cmd = typer.style(f"{project_slug} ai chat", bold=True)
+    return [
+        t("add_service.ai_set_provider", env_var=provider_var),
+        t("add_service.ai_set_api_key", env_var=api_key_var),
+        t("add_service.ai_test_cli", cmd=cmd),
+    ]
+
+
+# Setup guidance shown after a successful add: base service name ->
+# (title i18n key, hint lines for the project slug). Printed in this order.
+_POST_ADD_HINTS: dict[str, tuple[str, Callable[[str], list[str]]]] = {
+    AnswerKeys.SERVICE_AUTH: ("add_service.auth_setup", _auth_setup_hints),
+    AnswerKeys.SERVICE_AI: ("add_service.ai_setup", _ai_setup_hints),
+}
+
+
 def add_service_command(
     services: str | None = typer.Argument(
         None,
@@ -138,6 +284,31 @@ def add_service_command(
     # Verify project is in a git repository (required for Copier updates)
     validate_git_repository(target_path)
 
+    # Deferred so that importing this module (e.g. for ``aegis --help``)
+    # does not pull in copier, jinja2, yaml or the service registries.
+    from ..cli.callbacks import _split_service_list
+    from ..core.auth_service_parser import (
+        is_auth_service_with_options,
+        parse_auth_service_config,
+    )
+    from ..core.component_utils import (
+        extract_base_component_name,
+        extract_base_service_name,
+    )
+    from ..core.components import COMPONENTS, CORE_COMPONENTS
+    from ..core.copier_manager import load_copier_answers
+    from ..core.manual_updater import ManualUpdater
+    from ..core.migration_generator import (
+        MIGRATION_SPECS,
+        bootstrap_alembic,
+        generate_migration,
+        get_services_needing_migrations,
+        service_has_migration,
+    )
+    from ..core.project_map import render_project_map
+    from ..core.service_resolver import ServiceResolver
+    from ..core.services import SERVICES, get_service_dependencies
+
     # Parse services (respecting bracket syntax like ai[langchain,sqlite])
     assert services is not None  # Already validated by check above
     selected_services = _split_service_list(services)
@@ -168,13 +339,20 @@ def add_service_command(
         brand.error(t("add_service.load_config_failed", error=e), err=True)
         raise typer.Exit(1)
 
+    # Names whose include_<name> flag is set, so the enabled checks below
+    # are set lookups instead of per-name key building.
+    enabled_names = {
+        key.removeprefix(AnswerKeys.INCLUDE_PREFIX)
+        for key, value in existing_answers.items()
+        if value is True and key.startswith(AnswerKeys.INCLUDE_PREFIX)
+    }
+
     # Check which services are already enabled
     already_enabled = []
     for service in selected_services:
         # Check if service is already enabled in answers (use base name for bracket syntax)
         base_service = service_base_map[service]
-        include_key = AnswerKeys.include_key(base_service)
-        if existing_answers.get(include_key) is True:
+        if base_service in enabled_names:
             # Special case: auth level upgrades (basic → rbac → org)
             if base_service == AnswerKeys.SERVICE_AUTH and is_auth_service_with_options(
                 service
@@ -201,24 +379,28 @@ def add_service_command(
         )
 
     # Filter out already enabled services
-    services_to_add = [s for s in selected_services if s not in already_enabled]
+    already_enabled_set = set(already_enabled)
+    services_to_add = [s for s in selected_services if s not in already_enabled_set]
 
     if not services_to_add:
         brand.success(t("add_service.all_enabled"))
         raise typer.Exit(0)
 
+    # One record per service to add; everything below reads the base name
+    # from here instead of re-deriving it from the (possibly rewritten) spec.
+    plan = [_ServicePlan(s, service_base_map[s]) for s in services_to_add]
+
     # Handle AI service interactive configuration
     # We need to check if AI service is being added and prompt for configuration
-    ai_config: dict[str, str | list[str] | bool] = {}
-    for i, service in enumerate(services_to_add):
-        base_service = service_base_map[service]
-        if base_service == AnswerKeys.SERVICE_AI:
-            if not service.startswith("ai["):
+    ai_config: _AIConfig = {}
+    for entry in plan:
+        if entry.base == AnswerKeys.SERVICE_AI:
+            if not entry.full.startswith("ai["):
                 # AI service without bracket syntax - prompt for configuration
                 from ..cli.interactive import interactive_ai_service_config
 
                 backend, framework, providers, rag_enabled, voice_enabled = (
-                    interactive_ai_service_config(base_service)
+                    interactive_ai_service_config(entry.base)
                 )
 
                 # Store config for later use
@@ -234,23 +416,19 @@ def add_service_command(
                     options.append("rag")
                 if voice_enabled:
                     options.append("voice")
-                service_string = f"{base_service}[{','.join(options)}]"
-                services_to_add[i] = service_string
-
-                # Update the mapping with the new full service name
-                service_base_map[service_string] = base_service
-                # Remove old mapping entry
-                del service_base_map[service]
+                entry.full = f"{entry.base}[{','.join(options)}]"
             else:
                 # AI service with bracket syntax - parse backend from options
                 # Format: ai[backend,framework,provider1,provider2,...]
                 from ..core.ai_service_parser import parse_ai_service_config
 
-                config = parse_ai_service_config(service)
+                config = parse_ai_service_config(entry.full)
                 ai_config["backend"] = config.backend
                 ai_config["framework"] = config.framework
                 ai_config["providers"] = config.providers
 
+    services_to_add = [entry.full for entry in plan]
+
     # Resolve service dependencies to components
     try:
         required_components, _ = ServiceResolver.resolve_service_dependencies(
@@ -267,26 +445,19 @@ def add_service_command(
     ):
         required_components.append(ComponentNames.DATABASE)
 
-    # Check which components are already enabled
-    enabled_components = []
-    missing_components = []
-
-    for component in required_components:
-        include_key = AnswerKeys.include_key(component)
-        if existing_answers.get(include_key) is True or component in CORE_COMPONENTS:
-            enabled_components.append(component)
-        else:
-            missing_components.append(component)
+    # Check which components are already enabled (core ones always are)
+    present_components = enabled_names.union(CORE_COMPONENTS)
+    enabled_components = [c for c in required_components if c in present_components]
+    missing_components = [c for c in required_components if c not in present_components]
 
     # Show what will be added
     brand.accent(f"\n{t('add_service.services_to_add')}", bold=True)
-    for service in services_to_add:
-        base_service = service_base_map[service]
-        if base_service in SERVICES:
+    for entry in plan:
+        if entry.base in SERVICES:
             desc = _translated_service_desc(
-                base_service, SERVICES[base_service].description
+                entry.base, SERVICES[entry.base].description
             )
-            typer.echo(f"   • {service}: {desc}")
+            typer.echo(f"   • {entry.full}: {desc}")
 
     # Show component requirements
     if missing_components:
@@ -312,21 +483,6 @@ def add_service_command(
         brand.error(t("shared.operation_cancelled"))
         raise typer.Exit(0)
 
-    # Prepare update data for ManualUpdater
-    update_data: dict[str, bool | str] = {}
-
-    # Add service flags (use base service name to handle bracket syntax like ai[sqlite])
-    for service in services_to_add:
-        base_service = service_base_map[service]
-        include_key = AnswerKeys.include_key(base_service)
-        update_data[include_key] = True
-
-    # Add missing component flags (use base component name to handle bracket syntax)
-    for component in missing_components:
-        base_component = extract_base_component_name(component)
-        include_key = AnswerKeys.include_key(base_component)
-        update_data[include_key] = True
-
     # Add services using ManualUpdater
     try:
         updater = ManualUpdater(target_path)
@@ -335,154 +491,44 @@ def add_service_command(
         for component in missing_components:
             brand.accent(f"\n{t('add_service.adding_component', component=component)}")
 
-            # Prepare component-specific data
-            component_data: dict[str, bool | str] = {}
-
-            # Handle scheduler backend if needed
-            if component == ComponentNames.SCHEDULER:
-                scheduler_backend = detect_scheduler_backend([component])
-                component_data[AnswerKeys.SCHEDULER_BACKEND] = scheduler_backend
-                component_data[AnswerKeys.SCHEDULER_WITH_PERSISTENCE] = (
-                    scheduler_backend == StorageBackends.SQLITE
-                )
-            elif component == ComponentNames.DATABASE:
-                component_data[AnswerKeys.DATABASE_ENGINE] = StorageBackends.SQLITE
-
-            # Add the component
-            result = updater.add_component(component, component_data)
-
-            if not result.success:
-                brand.error(
-                    t(
-                        "add_service.failed_component",
-                        component=component,
-                        error=result.error_message,
-                    ),
-                    err=True,
-                )
-                raise typer.Exit(1)
-
-            if result.files_modified:
-                brand.success(
-                    f"   {t('add_service.added_files', count=len(result.files_modified))}"
-                )
-            if result.files_skipped:
-                brand.warn(
-                    f"   {t('add_service.skipped_files', count=len(result.files_skipped))}"
-                )
-            if result.files_deleted:
-                brand.accent(
-                    f"   Cleaned {len(result.files_deleted)} empty stub file(s)"
-                )
-            if result.shared_files_need_manual_merge:
-                brand.warn(
-                    f"   {t('add_service.preserved_files', count=len(result.shared_files_need_manual_merge))}"
-                )
+            # Add the component; ``uv sync`` / ``make fix`` run once below
+            result = updater.add_component(
+                component, _component_add_data(component), run_post_gen=False
+            )
+            _report_add_result(
+                result, "add_service.failed_component", component=component
+            )
 
         # Now add each service sequentially
-        for service in services_to_add:
-            brand.accent(f"\n{t('add_service.adding_service', service=service)}")
-
-            # Prepare service-specific data
-            service_data: dict[str, bool | str] = {}
-
-            # Get base service name (strips variant syntax like [langchain,sqlite])
-            base_service = service_base_map[service]
-
-            # For auth service, pass auth level data
-            if base_service == AnswerKeys.SERVICE_AUTH and is_auth_service_with_options(
-                service
-            ):
-                auth_config = parse_auth_service_config(service)
-                service_data[AnswerKeys.AUTH_LEVEL] = auth_config.level
-                service_data[AnswerKeys.AUTH_RBAC] = auth_config.level in (
-                    AuthLevels.RBAC,
-                    AuthLevels.ORG,
-                )
-                service_data[AnswerKeys.AUTH_ORG] = auth_config.level == AuthLevels.ORG
-
-            # For AI service, use the captured configuration
-            if base_service == AnswerKeys.SERVICE_AI:
-                # Use providers from interactive config, or default to openai
-                providers = ai_config.get("providers", [AIProviders.OPENAI])
-                if isinstance(providers, list):
-                    service_data[AnswerKeys.AI_PROVIDERS] = ",".join(providers)
-                else:
-                    service_data[AnswerKeys.AI_PROVIDERS] = str(providers)
-
-                # Set backend and framework for pyproject.toml regeneration
-                # This ensures alembic is included when sqlite backend is selected
-                backend = ai_config.get("backend", StorageBackends.MEMORY)
-                framework = ai_config.get("framework", "pydantic-ai")
-                # Ensure backend and framework are strings (not lists from ai_config)
-                if isinstance(backend, str):
-                    service_data[AnswerKeys.AI_BACKEND] = backend
-                if isinstance(framework, str):
-                    service_data[AnswerKeys.AI_FRAMEWORK] = framework
-
-            # For insights service, pass source flags
-            if base_service == AnswerKeys.SERVICE_INSIGHTS:
-                from ..core.insights_service_parser import (
-                    DEFAULT_SOURCES,
-                    is_insights_service_with_options,
-                    parse_insights_service_config,
-                )
+        for entry in plan:
+            brand.accent(f"\n{t('add_service.adding_service', service=entry.full)}")
 
-                if is_insights_service_with_options(service):
-                    insights_config = parse_insights_service_config(service)
-                    sources = insights_config.sources
-                else:
-                    sources = DEFAULT_SOURCES
-                service_data[AnswerKeys.INSIGHTS_GITHUB] = "github" in sources
-                service_data[AnswerKeys.INSIGHTS_PYPI] = "pypi" in sources
-                service_data[AnswerKeys.INSIGHTS_PLAUSIBLE] = "plausible" in sources
-                service_data[AnswerKeys.INSIGHTS_REDDIT] = "reddit" in sources
+            prepare = _SERVICE_ADD_DATA.get(entry.base)
+            service_data = prepare(entry.full, ai_config) if prepare else {}
 
             # Add the service (services are added like components)
-            # Use base_service for file lookup, not the full variant name
-            result = updater.add_component(base_service, service_data)
-
-            if not result.success:
-                brand.error(
-                    t(
-                        "add_service.failed_service",
-                        service=service,
-                        error=result.error_message,
-                    ),
-                    err=True,
-                )
-                raise typer.Exit(1)
+            # Use the base name for file lookup, not the full variant name
+            result = updater.add_component(entry.base, service_data, run_post_gen=False)
+            _report_add_result(result, "add_service.failed_service", service=entry.full)
 
-            # Show results
-            if result.files_modified:
-                brand.success(
-                    f"   {t('add_service.added_files', count=len(result.files_modified))}"
-                )
-            if result.files_skipped:
-                brand.warn(
-                    f"   {t('add_service.skipped_files', count=len(result.files_skipped))}"
-                )
-            if result.files_deleted:
-                brand.accent(
-                    f"   Cleaned {len(result.files_deleted)} empty stub file(s)"
-                )
-            if result.shared_files_need_manual_merge:
-                brand.warn(
-                    f"   {t('add_service.preserved_files', count=len(result.shared_files_need_manual_merge))}"
-                )
+        # Every add above deferred post-gen; sync deps and format once for
+        # the whole batch, before migrations need the synced environment.
+        updater.run_post_generation_tasks()
 
-        # Generate migrations for services that need them
-        for service in services_to_add:
-            base_service = service_base_map[service]
-            if base_service not in MIGRATION_SPECS:
-                continue
-
-            # AI service only needs migrations with SQLite backend (not memory)
-            if base_service == AnswerKeys.SERVICE_AI:
-                ai_backend = ai_config.get("backend", StorageBackends.MEMORY)
-                if ai_backend == StorageBackends.MEMORY:
-                    continue  # Skip migrations for memory backend
+        # Services that own migrations. The AI service only needs them with
+        # a persistence backend (not memory).
+        ai_needs_migrations = (
+            ai_config.get("backend", StorageBackends.MEMORY) != StorageBackends.MEMORY
+        )
+        services_with_migrations = [
+            entry
+            for entry in plan
+            if entry.base in MIGRATION_SPECS
+            and (entry.base != AnswerKeys.SERVICE_AI or ai_needs_migrations)
+        ]
 
+        # Generate migrations for services that need them
+        for entry in services_with_migrations:
             alembic_dir = target_path / "alembic"
             if not alembic_dir.exists():
                 brand.accent(f"\n{t('add_service.bootstrap_alembic')}")
@@ -492,8 +538,8 @@ def add_service_command(
                 for f in created:
                     typer.echo(f"   {t('add_service.created_file', file=f)}")
 
-            if not service_has_migration(target_path, base_service):
-                migration_path = generate_migration(target_path, base_service)
+            if not service_has_migration(target_path, entry.base):
+                migration_path = generate_migration(target_path, entry.base)
                 if migration_path:
                     brand.success(
                         f"   {t('add_service.generated_migration', name=migration_path.name)}"
@@ -514,16 +560,6 @@ def add_service_command(
                     )
 
         # Auto-run migrations for services that need them
-        # Exclude AI service with memory backend (doesn't need migrations)
-        ai_needs_migrations = (
-            ai_config.get("backend", StorageBackends.MEMORY) != StorageBackends.MEMORY
-        )
-        services_with_migrations = [
-            s
-            for s in services_to_add
-            if service_base_map[s] in MIGRATION_SPECS
-            and (service_base_map[s] != AnswerKeys.SERVICE_AI or ai_needs_migrations)
-        ]
         if services_with_migrations:
             brand.accent(f"\n{t('add_service.applying_migrations')}")
             from ..core.post_gen_tasks import run_migrations
@@ -538,9 +574,10 @@ def add_service_command(
             # the init path so an added ai service starts with the same
             # seeded registry a fresh project gets.
             ai_added = any(
-                service_base_map[s] == AnswerKeys.SERVICE_AI for s in services_to_add
+                entry.base == AnswerKeys.SERVICE_AI
+                for entry in services_with_migrations
             )
-            if migration_success and ai_added and ai_needs_migrations:
+            if migration_success and ai_added:
                 from ..core.post_gen_tasks import seed_ai_fixtures
 
                 seed_ai_fixtures(target_path)
@@ -548,17 +585,16 @@ def add_service_command(
         brand.success(f"\n{t('add_service.success')}")
 
         # Show project map with newly added services + auto-added components highlighted
-        base_services_for_highlight = [service_base_map[s] for s in services_to_add]
+        base_services_added = [entry.base for entry in plan]
         # Normalize missing_components to base names so highlight and uses are consistent
         normalized_missing = {
             extract_base_component_name(c) for c in missing_components
         }
-        all_newly_added = base_services_for_highlight + list(normalized_missing)
+        all_newly_added = base_services_added + list(normalized_missing)
 
         # Build uses dict for existing dependencies (components that already existed)
         uses: dict[str, list[str]] = {}
-        for service in services_to_add:
-            base_service = service_base_map[service]
+        for base_service in base_services_added:
             service_deps = get_service_dependencies(base_service)
             for dep in service_deps:
                 # Only show uses for components that already existed (not newly added)
@@ -574,34 +610,12 @@ def add_service_command(
 
         Messages.print_next_steps()
 
-        # Service-specific guidance (use base service names for comparison)
-        base_services_added = [service_base_map[s] for s in services_to_add]
-
-        if AnswerKeys.SERVICE_AUTH in base_services_added:
-            project_slug = existing_answers.get(AnswerKeys.PROJECT_SLUG, "my-project")
-            brand.accent(f"\n{t('add_service.auth_setup')}", bold=True)
-            cmd = typer.style(f"{project_slug} auth create-test-users", bold=True)
-            typer.echo(t("add_service.auth_create_users", cmd=cmd))
-            url = typer.style("http://localhost:8000/docs", bold=True)
-            typer.echo(t("add_service.auth_view_routes", url=url))
-
-        if AnswerKeys.SERVICE_AI in base_services_added:
-            project_slug = existing_answers.get(AnswerKeys.PROJECT_SLUG, "my-project")
-            brand.accent(f"\n{t('add_service.ai_setup')}", bold=True)
-            typer.echo(
-                t(
-                    "add_service.ai_set_provider",
-                    env_var=typer.style("AI_PROVIDER", bold=True),
-                )
-            )
-            typer.echo(
-                t(
-                    "add_service.ai_set_api_key",
-                    env_var=typer.style("OPENAI_API_KEY", bold=True),
-                )
-            )
-            cmd = typer.style(f"{project_slug} ai chat", bold=True)
-            typer.echo(t("add_service.ai_test_cli", cmd=cmd))
+        # Service-specific guidance, in table order (base names for comparison)
+        project_slug = existing_answers.get(AnswerKeys.PROJECT_SLUG, "my-project")
+        for service, (title_key, hints) in _POST_ADD_HINTS.items():
+            if service in base_services_added:
+                brand.accent(f"\n{t(title_key)}", bold=True)
+                typer.echo("\n".join(hints(project_slug)))
 
     except Exception as e:
         brand.error(f"\n{t('add_service.failed', error=e)}", err=True)
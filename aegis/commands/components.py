@@ -19,30 +19,31 @@ def _translated_desc(name: str, fallback: str) -> str:
 def components_command() -> None:
     """List available components and their dependencies."""
 
-    typer.echo(f"\n{t('components.core_title')}")
-    typer.echo("=" * 40)
+    # Collect the whole listing and write it in one echo.
+    lines = [f"\n{t('components.core_title')}", "=" * 40]
     for component in CORE_COMPONENTS:
         if component == ComponentNames.BACKEND:
-            typer.echo(t("components.backend_desc"))
+            lines.append(t("components.backend_desc"))
         elif component == ComponentNames.FRONTEND:
-            typer.echo(t("components.frontend_desc"))
+            lines.append(t("components.frontend_desc"))
 
-    def _print_section(title_key: str, component_type: ComponentType) -> None:
-        typer.echo(f"\n{t(title_key)}")
-        typer.echo("=" * 40)
+    def _add_section(title_key: str, component_type: ComponentType) -> None:
+        lines.append(f"\n{t(title_key)}")
+        lines.append("=" * 40)
         for name, spec in get_components_by_type(component_type).items():
             desc = _translated_desc(name, spec.description)
-            typer.echo(f"  {name:12} - {desc}")
+            lines.append(f"  {name:12} - {desc}")
             if spec.requires:
-                typer.echo(
+                lines.append(
                     f"               {t('components.requires', deps=', '.join(spec.requires))}"
                 )
             if spec.recommends:
-                typer.echo(
+                lines.append(
                     f"               {t('components.recommends', deps=', '.join(spec.recommends))}"
                 )
 
-    _print_section("components.infra_title", ComponentType.INFRASTRUCTURE)
-    _print_section("components.frontend_title", ComponentType.FRONTEND)
+    _add_section("components.infra_title", ComponentType.INFRASTRUCTURE)
+    _add_section("components.frontend_title", ComponentType.FRONTEND)
 
-    typer.echo(f"\n{t('components.usage_hint')}")
+    lines.append(f"\n{t('components.usage_hint')}")
+    typer.echo("\n".join(lines))
@@ -5,11 +5,13 @@ Provides commands for deploying Aegis projects to remote servers,
 with backup/rollback strategy and post-deploy health checks.
 """
 
+import os
 import re
 import shlex
 import subprocess
 import time
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 import typer
@@ -19,10 +21,20 @@ from ..cli import brand
 from ..constants import AnswerKeys, PostgresProviders
 from ..i18n import lazy_t, t
 
+# libyaml-backed (de)serialisers when PyYAML was built with them.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 _BACKUP_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{6}$")
 
 # Deploy config file name
 DEPLOY_CONFIG_FILE = ".aegis/deploy.yml"
+# Keys every deploy-* command reads straight out of ``server:``
+_REQUIRED_SERVER_KEYS = ("host", "user", "path")
 DEPLOY_CONFIG_EXAMPLE = """\
 # Aegis Deploy Configuration
 # Run 'aegis deploy-init' to create this file interactively
@@ -34,6 +46,8 @@ server:
 
 docker:
   context: {project_name}-remote
+  # Optional: build locally, push here, and have the server pull it
+  # image: ghcr.io/acme/{project_name}
 
 # Optional: domain for TLS (uncomment to enable)
 # domain: example.com
@@ -55,12 +69,22 @@ def _get_project_root(project_path: str | None = None) -> Path:
     """Find the project root by looking for pyproject.toml."""
     if project_path:
         return Path(project_path)
-    current = Path.cwd()
+    return _find_project_root(Path.cwd())
+
+
+@cache
+def _find_project_root(start: Path) -> Path:
+    """Walk up from ``start`` to the nearest directory with a pyproject.toml.
+
+    Memoised per start directory: one deploy invocation resolves the root
+    from several helpers, and each walk stats every ancestor.
+    """
+    current = start
     while current != current.parent:
         if (current / "pyproject.toml").exists():
             return current
         current = current.parent
-    return Path.cwd()
+    return start
 
 
 def _get_project_name(project_path: str | None = None) -> str:
@@ -85,7 +109,27 @@ def _load_deploy_config(project_path: str | None = None) -> dict | None:
         return None
 
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
+    if not config:
+        return None
+
+    server = config.get("server") if isinstance(config, dict) else None
+    missing = [
+        f"server.{key}"
+        for key in _REQUIRED_SERVER_KEYS
+        if not isinstance(server, dict) or not server.get(key)
+    ]
+    if missing:
+        brand.error(
+            t(
+                "deploy.config_invalid",
+                file=DEPLOY_CONFIG_FILE,
+                keys=", ".join(missing),
+            ),
+            err=True,
+        )
+        raise typer.Exit(1)
+    return config
 
 
 def _save_deploy_config(config: dict) -> None:
@@ -96,7 +140,13 @@ def _save_deploy_config(config: dict) -> None:
 
     config_path = config_dir / "deploy.yml"
     with open(config_path, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config,
+            f,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
 
 def _is_neon_database(project_path: str | None = None) -> bool:
@@ -114,34 +164,310 @@ def _is_neon_database(project_path: str | None = None) -> bool:
         return False
     try:
         with open(answers_path) as f:
-            answers = yaml.safe_load(f) or {}
+            answers = yaml.load(f, Loader=_YamlLoader) or {}
     except (OSError, yaml.YAMLError):
         return False
     return answers.get(AnswerKeys.POSTGRES_PROVIDER) == PostgresProviders.NEON
 
 
-def _compose_prefix(deploy_path: str) -> str:
-    """Return the docker compose command prefix for remote execution."""
+def _compose_prefix(deploy_path: str, image: str | None = None) -> str:
+    """Return the docker compose command prefix for remote execution.
+
+    ``image`` overrides the app image tag the compose files read from
+    ``AEGIS_STACK_TAG``.
+    """
     safe_path = shlex.quote(deploy_path)
+    tag_env = f"AEGIS_STACK_TAG={shlex.quote(image)} " if image else ""
     return (
-        f"cd {safe_path} && "
+        f"cd {safe_path} && {tag_env}"
         f"docker compose -f docker-compose.yml -f docker-compose.prod.yml"
         f" --profile prod"
     )
 
 
+# Written into the deploy path after a successful ``up`` with the registry
+# image ref that is now running. Backups snapshot the deploy path, so each
+# backup records which immutable image to pull back on rollback.
+_DEPLOYED_IMAGE_FILE = ".aegis-image"
+
+
+def _restart_services_command(
+    deploy_path: str,
+    *,
+    build: bool,
+    recreate: bool = False,
+    image: str | None = None,
+) -> str:
+    """Return one remote script that brings services up and restarts Traefik.
+
+    ``up -d --remove-orphans`` lets compose recreate only the containers
+    whose image or config changed instead of tearing the whole stack down
+    first; ``recreate`` forces every container to be rebuilt. With a
+    registry ``image`` the server pulls the pushed app image instead of
+    building it. Only a failed pull or ``up`` makes the script exit
+    non-zero; the Traefik restart stays best-effort. After a successful
+    ``up`` the running image ref is recorded in ``_DEPLOYED_IMAGE_FILE``
+    (or the file is removed for server-side builds) for later rollbacks.
+    """
+    prefix = _compose_prefix(deploy_path, image)
+    marker = shlex.quote(f"{deploy_path}/{_DEPLOYED_IMAGE_FILE}")
+    up_flags = " --remove-orphans"
+    if build and not image:
+        up_flags += " --build"
+    if recreate:
+        up_flags += " --force-recreate"
+    pull = f"{prefix} pull webserver && " if image else ""
+    record = (
+        f"printf '%s\\n' {shlex.quote(image)} > {marker}"
+        if image
+        else f"rm -f {marker}"
+    )
+    return (
+        f"{pull}{prefix} up -d{up_flags} || exit $?; "
+        f"{record}; "
+        f"if {prefix} ps traefik --quiet >/dev/null 2>&1; "
+        f"then {prefix} restart traefik || true; fi"
+    )
+
+
+@cache
+def _ssh_options() -> tuple[str, ...]:
+    """OpenSSH options shared by every ssh/scp/rsync call to the server.
+
+    A deploy makes many back-to-back calls to the same server. The first
+    becomes the control master and the rest reuse its socket, skipping a
+    fresh TCP + key exchange + auth handshake each time. The master lingers
+    for a minute so consecutive ``aegis deploy-*`` runs can reuse it too.
+    ``%C`` hashes user/host/port to keep the socket path short.
+
+    Connects give up after 10s, and an established session that stops
+    answering keepalives is dropped after ~45s, so a network blip fails the
+    deploy instead of wedging it on TCP timeouts mid-build.
+    """
+    control_dir = Path.home() / ".ssh"
+    control_dir.mkdir(mode=0o700, exist_ok=True)
+    return (
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={control_dir / 'aegis-%C'}",
+        "-o",
+        "ControlPersist=60s",
+        "-o",
+        "ConnectTimeout=10",
+        "-o",
+        "ServerAliveInterval=15",
+        "-o",
+        "ServerAliveCountMax=2",
+    )
+
+
+def _ssh_cmd(host: str, user: str, command: str) -> list[str]:
+    """Build the argv to run ``command`` on the server over the shared connection."""
+    return ["ssh", *_ssh_options(), f"{user}@{host}", command]
+
+
+def _scp_cmd(source: str, target: str) -> list[str]:
+    """Build the scp argv for a copy over the shared connection."""
+    return ["scp", *_ssh_options(), source, target]
+
+
+def _rsync_ssh_transport() -> str:
+    """Remote shell for ``rsync -e`` that reuses the shared connection."""
+    return shlex.join(["ssh", *_ssh_options()])
+
+
+_RSYNC_EXCLUDES = (
+    ".git",
+    "__pycache__",
+    ".venv",
+    "*.pyc",
+    ".pytest_cache",
+    ".ruff_cache",
+    "data/",
+    ".env",
+    ".env.deploy",
+    ".aegis/",
+    "backups/",
+    "node_modules/",
+)
+
+
+def _rsync_cmd(
+    host: str,
+    user: str,
+    project_root: Path,
+    deploy_path: str,
+    *,
+    create_dest: bool = False,
+    files_from_stdin: bool = False,
+) -> list[str]:
+    """Build the argv that syncs the working tree to ``deploy_path``.
+
+    With ``create_dest`` the remote ``mkdir -p`` rides along as rsync's
+    remote command instead of costing a separate SSH round trip. With
+    ``files_from_stdin`` rsync only considers the NUL-separated paths fed
+    on stdin; the exclude list still applies on top of them.
+    """
+    cmd = ["rsync", "-avz", "-e", _rsync_ssh_transport()]
+    if create_dest:
+        cmd += ["--rsync-path", f"mkdir -p {shlex.quote(deploy_path)} && rsync"]
+    if files_from_stdin:
+        cmd += ["--files-from=-", "--from0"]
+    for pattern in _RSYNC_EXCLUDES:
+        cmd += ["--exclude", pattern]
+    return [*cmd, f"{project_root}/", f"{user}@{host}:{deploy_path}/"]
+
+
+def _git_file_list(project_root: Path) -> bytes | None:
+    """Return the NUL-separated tracked + unignored files under ``project_root``.
+
+    ``None`` when the project is not in a git work tree (or git is missing),
+    so the caller falls back to walking the whole tree. Tracked files deleted
+    from the work tree are dropped here rather than via rsync's
+    ``--ignore-missing-args``, which the rsync shipped with macOS lacks.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(project_root),
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0 or not result.stdout:
+        return None
+    present = [
+        path
+        for path in result.stdout.split(b"\0")
+        if path and os.path.lexists(project_root / os.fsdecode(path))
+    ]
+    return b"".join(path + b"\0" for path in present) or None
+
+
+def _sync_working_tree(
+    host: str,
+    user: str,
+    project_root: Path,
+    deploy_path: str,
+    *,
+    create_dest: bool = False,
+) -> subprocess.CompletedProcess:
+    """rsync the project to the server, limited to git's file list when known."""
+    file_list = _git_file_list(project_root)
+    cmd = _rsync_cmd(
+        host,
+        user,
+        project_root,
+        deploy_path,
+        create_dest=create_dest,
+        files_from_stdin=file_list is not None,
+    )
+    return subprocess.run(cmd, input=file_list)
+
+
+def _deploy_env_file(project_root: Path) -> Path | None:
+    """Return the env file shipped to the server, preferring ``.env.deploy``."""
+    for name in (".env.deploy", ".env"):
+        candidate = project_root / name
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _image_tag(project_root: Path) -> str:
+    """Return a unique tag for a registry push.
+
+    The short git SHA of ``HEAD`` for a clean work tree. Deploys sync and
+    build uncommitted files too, so a dirty tree gets a ``-dirty-<UTC
+    timestamp>`` suffix to keep every distinct build on its own ref.
+    Outside git the tag is just the timestamp, in the same format as
+    backup names.
+    """
+    timestamp = datetime.now(UTC).strftime("%Y-%m-%d_%H%M%S")
+    git = ["git", "-C", str(project_root)]
+    try:
+        head = subprocess.run(
+            [*git, "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        )
+        if head.returncode != 0 or not head.stdout.strip():
+            return timestamp
+        status = subprocess.run(
+            [*git, "status", "--porcelain"], capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        return timestamp
+    sha = head.stdout.strip()
+    if status.returncode != 0 or status.stdout.strip():
+        return f"{sha}-dirty-{timestamp}"
+    return sha
+
+
+def _image_repository(image: str) -> str:
+    """Strip a tag from ``image`` (``reg:5000/app:v1`` -> ``reg:5000/app``)."""
+    name, _, last = image.rpartition("/")
+    if ":" in last:
+        last = last.split(":", 1)[0]
+    return f"{name}/{last}" if name else last
+
+
+def _build_and_push_image(
+    project_root: Path, image: str, env_file: Path | None
+) -> str | None:
+    """Build the app image locally and push it to its registry.
+
+    The image is pushed under an immutable tag from ``_image_tag`` plus
+    ``latest``. Builds through the same compose files the server uses, so
+    build args such as ``PORT`` resolve from the env file that ships with
+    the deploy. Returns the immutable image ref, or None on failure.
+    """
+    repository = _image_repository(image)
+    ref = f"{repository}:{_image_tag(project_root)}"
+    latest = f"{repository}:latest"
+    compose = [
+        "docker",
+        "compose",
+        "-f",
+        "docker-compose.yml",
+        "-f",
+        "docker-compose.prod.yml",
+        "--profile",
+        "prod",
+    ]
+    env = {**os.environ, "AEGIS_STACK_TAG": ref}
+    if env_file is not None:
+        compose += ["--env-file", str(env_file)]
+        env["AEGIS_STACK_ENV_FILE"] = str(env_file)
+    steps = [
+        [*compose, "build", "webserver"],
+        ["docker", "tag", ref, latest],
+        ["docker", "push", ref],
+        ["docker", "push", latest],
+    ]
+    for step in steps:
+        if subprocess.run(step, cwd=project_root, env=env).returncode != 0:
+            return None
+    return ref
+
+
 def _run_remote(host: str, user: str, command: str) -> subprocess.CompletedProcess:
     """Run a command on the remote server via SSH."""
-    return subprocess.run(["ssh", f"{user}@{host}", command])
+    return subprocess.run(_ssh_cmd(host, user, command))
 
 
 def _run_remote_capture(
     host: str, user: str, command: str
 ) -> subprocess.CompletedProcess:
     """Run a command on the remote server via SSH and capture output."""
-    return subprocess.run(
-        ["ssh", f"{user}@{host}", command], capture_output=True, text=True
-    )
+    return subprocess.run(_ssh_cmd(host, user, command), capture_output=True, text=True)
 
 
 def _install_pubkey_on_server(
@@ -161,9 +487,7 @@ def _install_pubkey_on_server(
         f"grep -qxF {quoted} ~/.ssh/authorized_keys || "
         f"echo {quoted} >> ~/.ssh/authorized_keys"
     )
-    return subprocess.run(
-        ["ssh", f"{user}@{host}", command], capture_output=True, text=True
-    )
+    return subprocess.run(_ssh_cmd(host, user, command), capture_output=True, text=True)
 
 
 def _remove_pubkey_from_server(
@@ -181,9 +505,7 @@ def _remove_pubkey_from_server(
         "  mv ~/.ssh/authorized_keys.tmp ~/.ssh/authorized_keys; "
         "fi"
     )
-    return subprocess.run(
-        ["ssh", f"{user}@{host}", command], capture_output=True, text=True
-    )
+    return subprocess.run(_ssh_cmd(host, user, command), capture_output=True, text=True)
 
 
 def _get_backup_config(config: dict) -> dict:
@@ -195,6 +517,11 @@ def _get_backup_config(config: dict) -> dict:
     }
 
 
+def _registry_image(config: dict) -> str | None:
+    """Return the registry image the app is pushed to, if one is configured."""
+    return (config.get("docker", {}) or {}).get("image")
+
+
 def _get_health_config(config: dict) -> dict:
     """Extract health check config with defaults."""
     hc = config.get("health_check", {}) or {}
@@ -308,7 +635,16 @@ def _rollback_to_backup(
         )
         return False
 
-    compose_prefix = _compose_prefix(deploy_path)
+    # Registry deploys record the immutable image they ran in the backup;
+    # pull that back instead of rebuilding on the server.
+    marker = shlex.quote(f"{backup_dir}/files/{_DEPLOYED_IMAGE_FILE}")
+    image_check = _run_remote_capture(host, user, f"cat {marker} 2>/dev/null")
+    image = (
+        image_check.stdout.strip()
+        if image_check.returncode == 0 and image_check.stdout
+        else None
+    )
+    compose_prefix = _compose_prefix(deploy_path, image)
 
     typer.echo(t("deploy.rollback_stopping"))
     _run_remote(host, user, f"{compose_prefix} down --remove-orphans")
@@ -362,7 +698,12 @@ def _rollback_to_backup(
             brand.warn(t("deploy.rollback_db_failed"))
 
     typer.echo(t("deploy.rollback_starting"))
-    start_result = _run_remote(host, user, f"{compose_prefix} up -d --build")
+    start_cmd = (
+        f"{compose_prefix} pull webserver && {compose_prefix} up -d"
+        if image
+        else f"{compose_prefix} up -d --build"
+    )
+    start_result = _run_remote(host, user, start_cmd)
     if start_result.returncode != 0:
         brand.error(t("deploy.rollback_start_failed"), err=True)
         return False
@@ -488,11 +829,11 @@ def _rolling_clear_pause(host: str, user: str, deploy_path: str) -> None:
     """Best-effort clear of the queue-pause flag. Safe to call repeatedly."""
     prefix = _rolling_compose_prefix(deploy_path)
     subprocess.run(
-        [
-            "ssh",
-            f"{user}@{host}",
+        _ssh_cmd(
+            host,
+            user,
             f"{prefix} exec -T redis redis-cli DEL {ROLLING_PAUSE_KEY} >/dev/null 2>&1 || true",
-        ],
+        ),
         capture_output=True,
     )
 
@@ -643,56 +984,18 @@ def _run_rolling_deploy(
 
     # Step 1: rsync working tree
     typer.echo(t("deploy.syncing"))
-    rsync_result = subprocess.run(
-        [
-            "rsync",
-            "-avz",
-            "--exclude",
-            ".git",
-            "--exclude",
-            "__pycache__",
-            "--exclude",
-            ".venv",
-            "--exclude",
-            "*.pyc",
-            "--exclude",
-            ".pytest_cache",
-            "--exclude",
-            ".ruff_cache",
-            "--exclude",
-            "data/",
-            "--exclude",
-            ".env",
-            "--exclude",
-            ".env.deploy",
-            "--exclude",
-            ".aegis/",
-            "--exclude",
-            "backups/",
-            "--exclude",
-            "node_modules/",
-            f"{project_root}/",
-            f"{user}@{host}:{deploy_path}/",
-        ]
-    )
+    rsync_result = _sync_working_tree(host, user, project_root, deploy_path)
     if rsync_result.returncode != 0:
         brand.error(t("deploy.sync_failed"), err=True)
         raise typer.Exit(1)
 
     # Step 2: scp .env (prefer .env.deploy)
-    deploy_env_file = project_root / ".env.deploy"
-    dev_env_file = project_root / ".env"
-    env_file: Path | None = None
-    if deploy_env_file.exists():
-        env_file = deploy_env_file
-    elif dev_env_file.exists():
-        env_file = dev_env_file
-
+    env_file = _deploy_env_file(project_root)
     if env_file is not None:
         typer.echo(t("deploy.copying_env", file=env_file.name))
         safe_path = shlex.quote(f"{deploy_path}/.env")
         env_result = subprocess.run(
-            ["scp", str(env_file), f"{user}@{host}:{safe_path}"]
+            _scp_cmd(str(env_file), f"{user}@{host}:{safe_path}")
         )
         if env_result.returncode != 0:
             brand.error(t("deploy.env_copy_failed"), err=True)
@@ -784,6 +1087,9 @@ def deploy_init_command(
     path: str | None = typer.Option(
         None, "--path", "-p", help=lazy_t("deploy.help_opt_path")
     ),
+    registry: str | None = typer.Option(
+        None, "--registry", help=lazy_t("deploy.help_opt_registry")
+    ),
     project_path: str | None = typer.Option(
         None, "--project-path", help=lazy_t("common.help_project_path")
     ),
@@ -796,6 +1102,7 @@ def deploy_init_command(
     Examples:\\n
         - aegis deploy-init --host 192.168.1.100\\n
         - aegis deploy-init --host myserver.com --user deploy\\n
+        - aegis deploy-init --host myserver.com --registry ghcr.io/acme\\n
     """
     project_name = _get_project_name(project_path)
     project_root = _get_project_root(project_path)
@@ -817,14 +1124,21 @@ def deploy_init_command(
             "context": f"{project_name}-remote",
         },
     }
+    if registry:
+        config["docker"]["image"] = f"{registry.rstrip('/')}/{project_name}"
 
     _save_deploy_config(config)
 
     brand.success(f"\n{t('deploy.init_saved', file=DEPLOY_CONFIG_FILE)}")
-    typer.echo(t("deploy.init_host", host=host))
-    typer.echo(t("deploy.init_user", user=user))
-    typer.echo(t("deploy.init_path", path=path))
-    typer.echo(t("deploy.init_docker_context", context=f"{project_name}-remote"))
+    summary = [
+        t("deploy.init_host", host=host),
+        t("deploy.init_user", user=user),
+        t("deploy.init_path", path=path),
+        t("deploy.init_docker_context", context=f"{project_name}-remote"),
+    ]
+    if registry:
+        summary.append(t("deploy.init_image", image=config["docker"]["image"]))
+    typer.echo("\n".join(summary))
 
     # Check if .aegis is in .gitignore
     gitignore_path = project_root / ".gitignore"
@@ -877,10 +1191,13 @@ def deploy_setup_command(
     result = subprocess.run(
         [
             "ssh",
+            # ssh keeps the first value given per option, so these must
+            # precede the shared defaults.
             "-o",
             "BatchMode=yes",
             "-o",
             "ConnectTimeout=5",
+            *_ssh_options(),
             f"{user}@{host}",
             "echo ok",
         ],
@@ -891,20 +1208,21 @@ def deploy_setup_command(
     if result.returncode != 0:
         if "Host key verification failed" in result.stderr:
             typer.echo(t("deploy.adding_host_key"))
-            keyscan_result = subprocess.run(
-                ["ssh-keyscan", "-H", host],
-                capture_output=True,
-                text=True,
-            )
+            # Stream ssh-keyscan's key lines straight into known_hosts.
+            known_hosts = Path.home() / ".ssh" / "known_hosts"
+            with open(known_hosts, "ab") as f:
+                keyscan_result = subprocess.run(
+                    ["ssh-keyscan", "-H", host],
+                    stdout=f,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
             if keyscan_result.returncode != 0:
                 brand.error(
                     t("deploy.ssh_keyscan_failed", error=keyscan_result.stderr),
                     err=True,
                 )
                 raise typer.Exit(1)
-            known_hosts = Path.home() / ".ssh" / "known_hosts"
-            with open(known_hosts, "a") as f:
-                f.write(keyscan_result.stdout)
         else:
             brand.error(t("deploy.ssh_failed", error=result.stderr), err=True)
             raise typer.Exit(1)
@@ -912,7 +1230,7 @@ def deploy_setup_command(
     # Copy and run setup script
     typer.echo(t("deploy.copying_script"))
     scp_result = subprocess.run(
-        ["scp", str(setup_script), f"{user}@{host}:/tmp/server-setup.sh"]
+        _scp_cmd(str(setup_script), f"{user}@{host}:/tmp/server-setup.sh")
     )
     if scp_result.returncode != 0:
         brand.error(t("deploy.copy_failed"), err=True)
@@ -920,11 +1238,7 @@ def deploy_setup_command(
 
     typer.echo(t("deploy.running_setup"))
     ssh_result = subprocess.run(
-        [
-            "ssh",
-            f"{user}@{host}",
-            "chmod +x /tmp/server-setup.sh && /tmp/server-setup.sh",
-        ]
+        _ssh_cmd(host, user, "chmod +x /tmp/server-setup.sh && /tmp/server-setup.sh")
     )
     if ssh_result.returncode != 0:
         brand.error(t("deploy.setup_failed"), err=True)
@@ -976,6 +1290,11 @@ def deploy_command(
         "--health-check/--no-health-check",
         help=lazy_t("deploy.help_opt_health"),
     ),
+    recreate: bool = typer.Option(
+        False,
+        "--recreate/--no-recreate",
+        help=lazy_t("deploy.help_opt_recreate"),
+    ),
     rolling: bool = typer.Option(
         False,
         "--rolling",
@@ -1009,6 +1328,7 @@ def deploy_command(
         - aegis deploy\\n
         - aegis deploy --no-build\\n
         - aegis deploy --no-backup --no-health-check\\n
+        - aegis deploy --recreate\\n
         - aegis deploy --rolling\\n
     """
     config = _load_deploy_config(project_path)
@@ -1041,6 +1361,18 @@ def deploy_command(
 
     brand.accent(t("deploy.deploying", host=host), bold=True)
 
+    env_file = _deploy_env_file(project_root)
+    image = _registry_image(config)
+
+    # Build and push the app image locally so the server only has to pull it
+    if image and build:
+        typer.echo(t("deploy.pushing_image", image=image))
+        pushed = _build_and_push_image(project_root, image, env_file)
+        if pushed is None:
+            brand.error(t("deploy.image_push_failed", image=image), err=True)
+            raise typer.Exit(1)
+        image = pushed
+
     # Step 1: Create backup before deploying
     backup_timestamp: str | None = None
     if backup:
@@ -1063,79 +1395,30 @@ def deploy_command(
 
     # Step 2: Sync files to server
     typer.echo(t("deploy.syncing"))
-    mkdir_result = subprocess.run(
-        ["ssh", f"{user}@{host}", f"mkdir -p {shlex.quote(deploy_path)}"]
-    )
-    if mkdir_result.returncode != 0:
-        brand.error(t("deploy.mkdir_failed", path=deploy_path), err=True)
-        raise typer.Exit(1)
-
-    rsync_result = subprocess.run(
-        [
-            "rsync",
-            "-avz",
-            "--exclude",
-            ".git",
-            "--exclude",
-            "__pycache__",
-            "--exclude",
-            ".venv",
-            "--exclude",
-            "*.pyc",
-            "--exclude",
-            ".pytest_cache",
-            "--exclude",
-            ".ruff_cache",
-            "--exclude",
-            "data/",
-            "--exclude",
-            ".env",
-            "--exclude",
-            ".env.deploy",
-            "--exclude",
-            ".aegis/",
-            "--exclude",
-            "backups/",
-            "--exclude",
-            "node_modules/",
-            f"{project_root}/",
-            f"{user}@{host}:{deploy_path}/",
-        ]
+    rsync_result = _sync_working_tree(
+        host, user, project_root, deploy_path, create_dest=True
     )
     if rsync_result.returncode != 0:
         brand.error(t("deploy.sync_failed"), err=True)
         raise typer.Exit(1)
 
     # Step 3: Copy .env file (prefer .env.deploy for production values)
-    deploy_env_file = project_root / ".env.deploy"
-    dev_env_file = project_root / ".env"
-    if deploy_env_file.exists():
-        env_file = deploy_env_file
-    elif dev_env_file.exists():
-        env_file = dev_env_file
-    else:
-        env_file = None
-
     if env_file is not None:
         typer.echo(t("deploy.copying_env", file=env_file.name))
         safe_path = shlex.quote(f"{deploy_path}/.env")
         env_result = subprocess.run(
-            ["scp", str(env_file), f"{user}@{host}:{safe_path}"]
+            _scp_cmd(str(env_file), f"{user}@{host}:{safe_path}")
         )
         if env_result.returncode != 0:
             brand.error(t("deploy.env_copy_failed"), err=True)
             raise typer.Exit(1)
 
-    # Step 4: Stop existing services
-    typer.echo(t("deploy.stopping"))
-    compose_prefix = _compose_prefix(deploy_path)
-    _run_remote(host, user, f"{compose_prefix} down --remove-orphans")
-
-    # Step 5: Build and start services
+    # Steps 4-5: Build/start changed services and restart Traefik in one session
     typer.echo(t("deploy.building"))
-    build_flag = "--build" if build else ""
-    compose_cmd = f"{compose_prefix} up -d {build_flag}"
-    compose_result = subprocess.run(["ssh", f"{user}@{host}", compose_cmd])
+    restart_cmd = _restart_services_command(
+        deploy_path, build=build, recreate=recreate, image=image
+    )
+    compose_result = subprocess.run(_ssh_cmd(host, user, restart_cmd))
     if compose_result.returncode != 0:
         brand.error(t("deploy.start_failed"), err=True)
         if backup_timestamp and health_cfg["auto_rollback"]:
@@ -1143,16 +1426,7 @@ def deploy_command(
             _rollback_to_backup(host, user, deploy_path, backup_timestamp, neon=neon)
         raise typer.Exit(1)
 
-    # Step 6: Restart Traefik if present
-    prefix = _compose_prefix(deploy_path)
-    traefik_check = subprocess.run(
-        ["ssh", f"{user}@{host}", f"{prefix} ps traefik --quiet 2>/dev/null"],
-        capture_output=True,
-    )
-    if traefik_check.returncode == 0:
-        _run_remote(host, user, f"{prefix} restart traefik")
-
-    # Step 7: Health check + auto-rollback
+    # Step 6: Health check + auto-rollback
     if health_check:
         healthy = _run_health_check(
             host,
@@ -1175,10 +1449,16 @@ def deploy_command(
                 raise typer.Exit(1)
 
     brand.success(f"\n{t('deploy.complete')}", bold=True)
-    typer.echo(t("deploy.app_running", host=host))
-    typer.echo(t("deploy.overseer", host=host))
-    typer.echo(t("deploy.view_logs"))
-    typer.echo(t("deploy.check_status"))
+    typer.echo(
+        "\n".join(
+            [
+                t("deploy.app_running", host=host),
+                t("deploy.overseer", host=host),
+                t("deploy.view_logs"),
+                t("deploy.check_status"),
+            ]
+        )
+    )
 
 
 def deploy_backup_command(
@@ -1327,7 +1607,7 @@ def deploy_rollback_command(
         # Restart Traefik if present
         prefix = _compose_prefix(deploy_path)
         traefik_check = subprocess.run(
-            ["ssh", f"{user}@{host}", f"{prefix} ps traefik --quiet 2>/dev/null"],
+            _ssh_cmd(host, user, f"{prefix} ps traefik --quiet 2>/dev/null"),
             capture_output=True,
         )
         if traefik_check.returncode == 0:
@@ -1485,6 +1765,7 @@ def deploy_shell_command(
     subprocess.run(
         [
             "ssh",
+            *_ssh_options(),
             "-t",
             f"{user}@{host}",
             f"{_compose_prefix(deploy_path)} exec {service} /bin/bash",
@@ -1771,12 +2052,17 @@ def deploy_cd_setup_command(
     brand.accent(
         t("deploy.cd_title", repo=repo_slug, target=f"{user}@{host}"), bold=True
     )
-    typer.echo(t("deploy.cd_plan_header"))
-    typer.echo(t("deploy.cd_plan_keygen"))
-    typer.echo(t("deploy.cd_plan_install", user=user, host=host))
-    typer.echo(t("deploy.cd_plan_secrets", repo=repo_slug))
+    workflow_rel = str(workflow_path.relative_to(project_root))
     typer.echo(
-        t("deploy.cd_plan_workflow", path=str(workflow_path.relative_to(project_root)))
+        "\n".join(
+            [
+                t("deploy.cd_plan_header"),
+                t("deploy.cd_plan_keygen"),
+                t("deploy.cd_plan_install", user=user, host=host),
+                t("deploy.cd_plan_secrets", repo=repo_slug),
+                t("deploy.cd_plan_workflow", path=workflow_rel),
+            ]
+        )
     )
 
     if dry_run:
@@ -1854,12 +2140,7 @@ def deploy_cd_setup_command(
             raise typer.Exit(1)
 
     # Scaffold workflow
-    typer.echo(
-        t(
-            "deploy.cd_writing_workflow",
-            path=str(workflow_path.relative_to(project_root)),
-        )
-    )
+    typer.echo(t("deploy.cd_writing_workflow", path=workflow_rel))
     workflow_path.parent.mkdir(parents=True, exist_ok=True)
     workflow_path.write_text(
         _render_deploy_workflow(
@@ -1872,13 +2153,19 @@ def deploy_cd_setup_command(
     config.setdefault("ci", {})["github"] = {
         "repo": repo_slug,
         "deploy_key_fingerprint": fingerprint,
-        "workflow_path": str(workflow_path.relative_to(project_root)),
+        "workflow_path": workflow_rel,
     }
     # _save_deploy_config relies on cwd; pass project_path through directly
     config_path = project_root / DEPLOY_CONFIG_FILE
     config_path.parent.mkdir(exist_ok=True)
     with open(config_path, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config,
+            f,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
     # Optional: keep a local copy of the private key
     if keep_key:
@@ -1903,9 +2190,7 @@ def deploy_cd_setup_command(
 
     brand.success(f"\n{t('deploy.cd_complete')}", bold=True)
     typer.echo(t("deploy.cd_fingerprint", fingerprint=fingerprint))
-    typer.echo(
-        t("deploy.cd_next_commit", path=str(workflow_path.relative_to(project_root)))
-    )
+    typer.echo(t("deploy.cd_next_commit", path=workflow_rel))
     typer.echo(t("deploy.cd_next_run"))
     if not keep_key:
         typer.echo("")
@@ -71,6 +71,7 @@ def ingress_enable_command(
     answers = load_copier_answers(target_path)
 
     # Step 1: Ensure ingress component is enabled
+    updater: ManualUpdater | None = None
     ingress_enabled = answers.get(AnswerKeys.INGRESS, False)
     if not ingress_enabled:
         typer.echo(f"\n{t('ingress.not_found')}")
@@ -137,7 +138,10 @@ def ingress_enable_command(
     # Step 5: Update answers and regenerate files
     typer.echo(f"\n{t('ingress.enabling')}")
 
-    updater = ManualUpdater(target_path)
+    # Reuse the updater from Step 1 if it added ingress; its answers already
+    # reflect that addition.
+    if updater is None:
+        updater = ManualUpdater(target_path)
 
     # Build updated answers
     updated_answers = {
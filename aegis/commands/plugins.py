@@ -125,17 +125,15 @@ def _core_command_reserved_names() -> set[str]:
     """Names already taken by core CLI commands and groups.
 
     Mirrors the reserved set passed at mount time in
-    ``aegis/__main__.py:_mount_plugin_cli_apps`` so that ``aegis plugins
+    ``aegis/cli/app.py:_mount_plugin_cli_apps`` so that ``aegis plugins
     info``'s ``CLI: yes/no`` indicator matches what would actually
     happen if the plugin's CLI sub-app were mounted. Lazy-imports
-    ``aegis.__main__`` to avoid a circular at module load — by the time
-    any CLI command runs, ``__main__`` is fully imported.
+    ``aegis.cli.app`` to avoid a circular at module load — by the time
+    any CLI command runs, the app has already been built.
     """
-    from aegis.__main__ import app
+    from ..cli.app import get_app, reserved_command_names
 
-    reserved = {cmd.name for cmd in app.registered_commands if cmd.name}
-    reserved.update(grp.name for grp in app.registered_groups if grp.name)
-    return reserved
+    return reserved_command_names(get_app())
 
 
 # ---------------------------------------------------------------------
@@ -9,7 +9,7 @@ from ..core.services import (
 )
 from ..core.services import (
     ServiceType,
-    get_services_by_type,
+    group_services_by_type,
 )
 from ..i18n import t
 
@@ -29,11 +29,11 @@ def services_command() -> None:
 
     # Group services by type, in enum-declaration order (single source of
     # truth — a new ServiceType shows up here automatically).
-    service_types = list(ServiceType)
+    grouped = group_services_by_type()
 
     services_found = False
-    for service_type in service_types:
-        type_services = get_services_by_type(service_type)
+    for service_type in ServiceType:
+        type_services = grouped.get(service_type)
         if type_services:
             services_found = True
             header = t(_SERVICE_TYPE_KEYS[service_type])
@@ -166,6 +166,56 @@ def _template_version_for_ref(target_ref: str) -> str:
     return target_ref
 
 
+def _commit_answers_file(target_path: Path, message: str) -> None:
+    """Commit ``.copier-answers.yml`` so copier sees a clean git tree.
+
+    A pathspec commit stages and commits the tracked file in one git
+    process. Git rejects that form for an untracked file, so when it fails
+    and ``git ls-files --error-unmatch`` confirms the file is untracked
+    (exit status, not git's translated error text) it falls back to
+    ``git add`` + ``git commit``. ``git commit`` also exits
+    non-zero when there is nothing to commit, which is harmless; only
+    abort when the answers file is actually left dirty (e.g. the commit
+    was blocked by a pre-commit hook), since copier would otherwise fail
+    with a confusing error several steps later.
+    """
+    commit_cmd = ["git", "commit", "-m", message, "--", AnswerKeys.ANSWERS_FILENAME]
+    commit = subprocess.run(commit_cmd, cwd=target_path, capture_output=True)
+    if commit.returncode != 0:
+        tracked = subprocess.run(
+            ["git", "ls-files", "--error-unmatch", AnswerKeys.ANSWERS_FILENAME],
+            cwd=target_path,
+            capture_output=True,
+        )
+        if tracked.returncode != 0:
+            subprocess.run(
+                ["git", "add", AnswerKeys.ANSWERS_FILENAME],
+                cwd=target_path,
+                capture_output=True,
+            )
+            commit = subprocess.run(commit_cmd, cwd=target_path, capture_output=True)
+    if commit.returncode == 0:
+        return
+
+    status = subprocess.run(
+        ["git", "status", "--porcelain", AnswerKeys.ANSWERS_FILENAME],
+        cwd=target_path,
+        capture_output=True,
+        text=True,
+    )
+    if not status.stdout.strip():
+        return
+    stderr = commit.stderr.decode("utf-8", errors="replace").strip()
+    brand.error(
+        "Failed to commit .copier-answers.yml; "
+        "aborting because copier requires a clean git tree.",
+        err=True,
+    )
+    if stderr:
+        typer.echo(stderr, err=True)
+    raise typer.Exit(1)
+
+
 def _advance_copier_tracking(
     project_path: Path, target_ref: str, template_root: Path
 ) -> None:
@@ -432,48 +482,32 @@ def update_command(
         import yaml
         from copier import run_update
 
+        # Parse .copier-answers.yml once for both pre-update rewrites below
+        # (custom _src_path and detected-flag backfill); each rewrite keeps
+        # this dict in sync with what it writes back to disk.
+        answers_file = target_path / AnswerKeys.ANSWERS_FILENAME
+        pre_answers: dict | None = None
+        if answers_file.exists():
+            with open(answers_file) as f:
+                pre_answers = yaml.safe_load(f) or {}
+
         # Prepare .copier-answers.yml for the update
         # If custom template path was provided, update _src_path
         # so Copier reads the template from the correct location.
         # This is necessary because Copier's git detection only works reliably
         # when reading _src_path from the answers file, not when passed as src_path.
-        if effective_template_path:
-            answers_file = target_path / AnswerKeys.ANSWERS_FILENAME
-            if answers_file.exists():
-                with open(answers_file) as f:
-                    answers = yaml.safe_load(f) or {}
+        if effective_template_path and pre_answers is not None:
+            # Update _src_path to point to custom template
+            # Use git+file:// URL format so Copier recognizes it as git-tracked
+            pre_answers["_src_path"] = f"git+file://{template_root}"
 
-                # Update _src_path to point to custom template
-                # Use git+file:// URL format so Copier recognizes it as git-tracked
-                answers["_src_path"] = f"git+file://{template_root}"
+            with open(answers_file, "w") as f:
+                yaml.safe_dump(
+                    pre_answers, f, default_flow_style=False, sort_keys=False
+                )
 
-                with open(answers_file, "w") as f:
-                    yaml.safe_dump(
-                        answers, f, default_flow_style=False, sort_keys=False
-                    )
-
-                # Commit the updated answers (Copier requires clean repo)
-                try:
-                    subprocess.run(
-                        ["git", "add", AnswerKeys.ANSWERS_FILENAME],
-                        cwd=target_path,
-                        check=True,
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        [
-                            "git",
-                            "commit",
-                            "-m",
-                            "Update template path for aegis update",
-                        ],
-                        cwd=target_path,
-                        check=True,
-                        capture_output=True,
-                    )
-                except subprocess.CalledProcessError:
-                    # If commit fails (e.g., no changes), that's OK
-                    pass
+            # Commit the updated answers (Copier requires clean repo)
+            _commit_answers_file(target_path, "Update template path for aegis update")
 
         # Get the set of files that actually changed in the template between versions
         # so sync_template_changes() only touches those, not every project customization
@@ -496,80 +530,27 @@ def update_command(
         # post_generation_tasks) sees the correct state.
         # See ``_detect_existing_features`` for full reasoning + scope.
         detected_flags = _detect_existing_features(target_path)
-        if detected_flags:
-            answers_path = target_path / AnswerKeys.ANSWERS_FILENAME
-            if answers_path.exists():
-                with open(answers_path) as f:
-                    current_answers = yaml.safe_load(f) or {}
-                # setdefault: only fill in MISSING flags. Don't overwrite an
-                # explicit ``False`` from a user who deliberately removed
-                # a service.
-                changed = False
-                for flag, value in detected_flags.items():
-                    if flag not in current_answers:
-                        current_answers[flag] = value
-                        changed = True
-                if changed:
-                    with open(answers_path, "w") as f:
-                        yaml.safe_dump(
-                            current_answers,
-                            f,
-                            default_flow_style=False,
-                            sort_keys=False,
-                        )
-                    # Copier requires a clean git tree, so commit the
-                    # backfill. If the commit fails (e.g. blocked by a
-                    # pre-commit hook) the working tree is left dirty —
-                    # which would cause copier to fail with a confusing
-                    # error several steps later. Verify the tree is clean
-                    # post-commit and abort with a clear message if not.
-                    try:
-                        subprocess.run(
-                            ["git", "add", AnswerKeys.ANSWERS_FILENAME],
-                            cwd=target_path,
-                            check=True,
-                            capture_output=True,
-                        )
-                        subprocess.run(
-                            [
-                                "git",
-                                "commit",
-                                "-m",
-                                "Backfill missing copier flags from project structure",
-                            ],
-                            cwd=target_path,
-                            check=True,
-                            capture_output=True,
-                        )
-                    except subprocess.CalledProcessError as exc:
-                        # ``git commit`` exits non-zero when there's
-                        # nothing to commit too — that's harmless. Only
-                        # abort if the answers file is actually dirty.
-                        status = subprocess.run(
-                            [
-                                "git",
-                                "status",
-                                "--porcelain",
-                                AnswerKeys.ANSWERS_FILENAME,
-                            ],
-                            cwd=target_path,
-                            capture_output=True,
-                            text=True,
-                        )
-                        if status.stdout.strip():
-                            stderr = (
-                                (exc.stderr or b"")
-                                .decode("utf-8", errors="replace")
-                                .strip()
-                            )
-                            brand.error(
-                                "Failed to commit backfilled .copier-answers.yml; "
-                                "aborting because copier requires a clean git tree.",
-                                err=True,
-                            )
-                            if stderr:
-                                typer.echo(stderr, err=True)
-                            raise typer.Exit(1) from exc
+        if detected_flags and pre_answers is not None:
+            # setdefault: only fill in MISSING flags. Don't overwrite an
+            # explicit ``False`` from a user who deliberately removed
+            # a service.
+            changed = False
+            for flag, value in detected_flags.items():
+                if flag not in pre_answers:
+                    pre_answers[flag] = value
+                    changed = True
+            if changed:
+                with open(answers_file, "w") as f:
+                    yaml.safe_dump(
+                        pre_answers,
+                        f,
+                        default_flow_style=False,
+                        sort_keys=False,
+                    )
+                # Copier requires a clean git tree, so commit the backfill.
+                _commit_answers_file(
+                    target_path, "Backfill missing copier flags from project structure"
+                )
 
         # Run Copier update with git-aware merge
         # NOTE: We do NOT pass src_path - Copier reads it from .copier-answers.yml
@@ -6,10 +6,18 @@ a single source of truth.
 """
 
 import re
+import tomllib
+from functools import cache
 from pathlib import Path
+from typing import Any
 
+_PYPROJECT_PATH = Path(__file__).parent.parent.parent / "pyproject.toml"
 
-def _parse_python_version_bounds() -> tuple[str, str]:
+
+@cache
+def _parse_python_version_bounds(
+    pyproject_path: Path = _PYPROJECT_PATH,
+) -> tuple[str, str]:
     """
     Parse Python version bounds from aegis-stack's pyproject.toml.
 
@@ -17,36 +25,34 @@ def _parse_python_version_bounds() -> tuple[str, str]:
     - Lower bound (minimum supported): "3.11"
     - Upper bound (maximum supported): "3.14" (derived from <3.15)
 
+    Args:
+        pyproject_path: pyproject.toml to read (defaults to aegis-stack's own)
+
     Returns:
         Tuple of (min_version, max_version) as strings
 
     Note:
-        Falls back to ("3.11", "3.14") if parsing fails.
+        Falls back to ("3.11", "3.14") if parsing fails. Cached, so the
+        file is read at most once per process.
     """
     try:
-        pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
-            content = pyproject_path.read_text()
-            for line in content.splitlines():
-                if "requires-python" in line and ">=" in line:
-                    # Parse: requires-python = ">=3.11,<3.14"
-                    # Extract the version spec
-                    spec = line.split("=", 1)[1].strip().strip('"')
-
-                    # Lower bound: >=3.11 → 3.11
-                    lower = spec.split(">=")[1].split(",")[0].strip()
-
-                    # Upper bound: <3.14 → 3.13 (max supported version)
-                    if "<" in spec:
-                        upper_spec = spec.split("<")[1].strip()
-                        major, minor = upper_spec.split(".")
-                        # <3.14 means max supported is 3.13
-                        upper = f"{major}.{int(minor) - 1}"
-                    else:
-                        upper = lower  # Fallback if no upper bound
-
-                    return (lower, upper)
-    except (FileNotFoundError, OSError, ValueError, IndexError):
+        with pyproject_path.open("rb") as f:
+            spec = tomllib.load(f)["project"]["requires-python"]
+
+        # Lower bound: >=3.11 → 3.11
+        lower = spec.split(">=")[1].split(",")[0].strip()
+
+        # Upper bound: <3.15 → 3.14 (max supported version)
+        if "<" in spec:
+            upper_spec = spec.split("<")[1].strip()
+            major, minor = upper_spec.split(".")
+            upper = f"{major}.{int(minor) - 1}"
+        else:
+            upper = lower  # Fallback if no upper bound
+
+        return (lower, upper)
+    except (OSError, KeyError, TypeError, ValueError, IndexError):
+        # tomllib.TOMLDecodeError is a ValueError subclass
         pass
 
     # Fallback defaults
@@ -85,9 +91,6 @@ def _generate_supported_versions(min_version: str, max_version: str) -> list[str
         return ["3.11", "3.12", "3.13"]  # Fallback
 
 
-# Parse bounds from pyproject.toml (single source of truth)
-_min_version, _max_version = _parse_python_version_bounds()
-
 # Default Python version for generated projects.
 #
 # Pinned to 3.13 (not the auto-derived max of 3.14) because the 3.14
@@ -99,8 +102,24 @@ _min_version, _max_version = _parse_python_version_bounds()
 # (or 3.11 / 3.12 — anything in SUPPORTED_PYTHON_VERSIONS works).
 DEFAULT_PYTHON_VERSION = "3.13"
 
-# Supported Python versions (auto-generated from min to max)
-SUPPORTED_PYTHON_VERSIONS = _generate_supported_versions(_min_version, _max_version)
+
+@cache
+def _supported_python_versions() -> tuple[str, ...]:
+    """Supported Python versions, auto-generated from pyproject's min to max."""
+    return tuple(_generate_supported_versions(*_parse_python_version_bounds()))
+
+
+def __getattr__(name: str) -> Any:
+    """Module-level lazy access for ``SUPPORTED_PYTHON_VERSIONS``.
+
+    Most importers of this module only want the URL/tag helpers, so
+    pyproject.toml is read on first access of the constant rather than
+    at import time. Each access gets its own list, so a caller mutating
+    it cannot change what other importers see.
+    """
+    if name == "SUPPORTED_PYTHON_VERSIONS":
+        return list(_supported_python_versions())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def version_to_git_tag(version: str) -> str:
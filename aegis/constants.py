@@ -23,12 +23,12 @@ class ComponentNames:
     INGRESS = "ingress"
     OBSERVABILITY = "observability"
 
-    # Ordered list for interactive selection. Worker leads and redis
-    # follows the steps that auto-add it (worker bundles redis), so most
-    # users never see the redis question; scheduler/database sit early
+    # Ordered (immutable) sequence for interactive selection. Worker leads
+    # and redis follows the steps that auto-add it (worker bundles redis), so
+    # most users never see the redis question; scheduler/database sit early
     # because their answers fix the project's database engine, which
     # later questions (AI storage) reuse.
-    INFRASTRUCTURE_ORDER = [
+    INFRASTRUCTURE_ORDER: tuple[str, ...] = (
         WORKER,
         SCHEDULER,
         DATABASE,
@@ -36,7 +36,7 @@ class ComponentNames:
         INGRESS,
         OBSERVABILITY,
         HTMX,
-    ]
+    )
 
 
 class StorageBackends:
@@ -226,6 +226,9 @@ class AnswerKeys:
     PROJECT_SLUG = "project_slug"
     SRC_PATH = "_src_path"
 
+    # Prefix of the per-component/service enable flags (include_<name>)
+    INCLUDE_PREFIX = "include_"
+
     @classmethod
     def include_key(cls, name: str) -> str:
         """Generate include key for component/service name."""
@@ -265,7 +268,6 @@ class Messages:
 
     # Component/service parsing
     EMPTY_COMPONENT_NAME = "Empty component name is not allowed"
-    EMPTY_SERVICE_NAME = "Empty service name is not allowed"
 
     # Interactive mode
     INTERACTIVE_IGNORES_ARGS = "Warning: --interactive flag ignores component arguments"
@@ -6,6 +6,7 @@ components by parsing the Copier template's exclusion rules.
 """
 
 import re
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -99,6 +100,14 @@ def get_copier_defaults() -> dict[str, Any]:
         Skips Jinja2-expression defaults (they depend on other variables).
         Returns empty dict if copier.yml is not available (e.g. pip install).
     """
+    # copier.yml ships with the package and never changes within a process;
+    # every ManualUpdater calls this, so parse it once and hand out copies.
+    return dict(_copier_defaults())
+
+
+@cache
+def _copier_defaults() -> dict[str, Any]:
+    """Parse copier.yml defaults once per process (see get_copier_defaults)."""
     try:
         config = load_copier_config()
     except FileNotFoundError:
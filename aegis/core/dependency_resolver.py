@@ -5,6 +5,8 @@ This module handles dependency resolution, validation, and recommendations
 for component selection during project generation.
 """
 
+from graphlib import TopologicalSorter
+
 from ..i18n import t
 from .component_utils import extract_base_component_name
 from .components import COMPONENTS
@@ -23,7 +25,8 @@ class DependencyResolver:
                                 (may include bracket syntax like database[sqlite])
 
         Returns:
-            Complete list of components including dependencies
+            Complete list of components including dependencies, ordered so
+            every component comes after the components it requires
 
         Raises:
             ValueError: If any selected components are invalid
@@ -51,7 +54,25 @@ class DependencyResolver:
             if len(resolved) == before_size:
                 break  # No new dependencies added
 
-        return sorted(resolved)
+        return DependencyResolver._install_order(resolved)
+
+    @staticmethod
+    def _install_order(components: set[str]) -> list[str]:
+        """Order components prerequisites-first, alphabetical within a level."""
+        by_base = {extract_base_component_name(c): c for c in components}
+        sorter: TopologicalSorter[str] = TopologicalSorter()
+        for name in components:
+            spec = COMPONENTS.get(extract_base_component_name(name))
+            requires = spec.requires if spec else []
+            sorter.add(name, *(by_base[r] for r in requires if r in by_base))
+
+        ordered: list[str] = []
+        sorter.prepare()
+        while sorter.is_active():
+            ready = sorted(sorter.get_ready())
+            ordered.extend(ready)
+            sorter.done(*ready)
+        return ordered
 
     @staticmethod
     def validate_components(components: list[str]) -> list[str]:
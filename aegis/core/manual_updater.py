@@ -255,7 +255,8 @@ class ManualUpdater:
         # from older projects) cause Jinja2 conditionals to inject unrelated
         # component code. See: #504
         copier_defaults = get_copier_defaults()
-        self.answers = {**copier_defaults, **load_copier_answers(project_path)}
+        persisted_answers = load_copier_answers(project_path)
+        self.answers = {**copier_defaults, **persisted_answers}
 
         # Heal answer-file drift before any shared-file regen consumes
         # ``self.answers``. Without this, a project whose
@@ -269,11 +270,10 @@ class ManualUpdater:
         # Copier must not be flipped to True just because the project
         # happens to have an ``alembic/`` dir hanging around — that
         # would over-promote and break the normal add-component path.
-        persisted_keys = set(load_copier_answers(project_path).keys())
         reconciled = {
             k: v
             for k, v in self.reconcile_answers_from_disk().items()
-            if k not in persisted_keys
+            if k not in persisted_answers
         }
         if reconciled:
             self.answers = {**self.answers, **reconciled}
@@ -753,6 +753,11 @@ class ManualUpdater:
         Rendered content is the template default, never user code, so the
         destructive fix rules are safe. Falls back to the raw render when
         ruff is unavailable or fails.
+
+        A file whose bytes already match is left alone, so regenerating
+        shared files for an answer change that doesn't reach them (e.g.
+        ``aegis ingress-enable`` flipping TLS keys) doesn't bump their
+        mtimes and set off editor and dev-server file watchers.
         """
         if output_path.suffix == ".py":
             # Normalize under the file's real project-relative path so the
@@ -762,6 +767,8 @@ class ManualUpdater:
             formatted = self._ruff_normalize(content, rel_path=rel)
             if formatted is not None:
                 content = formatted
+        if output_path.is_file() and output_path.read_bytes() == content.encode():
+            return
         output_path.write_text(content)
 
     def _ruff_format_safe(self, src: str, rel_path: str | None = None) -> str | None:
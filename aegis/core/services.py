@@ -996,6 +996,18 @@ def get_services_by_type(service_type: ServiceType) -> dict[str, ServiceSpec]:
     return {name: spec for name, spec in SERVICES.items() if spec.type == service_type}
 
 
+def group_services_by_type() -> dict[ServiceType, dict[str, ServiceSpec]]:
+    """Group all services by type in one pass over the registry.
+
+    Equivalent to calling ``get_services_by_type`` for every ``ServiceType``;
+    types with no services are absent. Registry order is kept within a type.
+    """
+    grouped: dict[ServiceType, dict[str, ServiceSpec]] = {}
+    for name, spec in SERVICES.items():
+        grouped.setdefault(spec.type, {})[name] = spec
+    return grouped
+
+
 def list_available_services() -> list[str]:
     """Get list of all available service names."""
     return list(SERVICES.keys())
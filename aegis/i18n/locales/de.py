@@ -688,11 +688,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "Keine Deploy-Konfiguration gefunden. Zuerst 'aegis deploy-init' ausführen."
     ),
+    "deploy.config_invalid": "{file} fehlen erforderliche Schlüssel: {keys}. Korrigieren oder aegis deploy-init erneut ausführen.",
     "deploy.init_saved": "Deploy-Konfiguration in {file} gespeichert",
     "deploy.init_host": "   Host: {host}",
     "deploy.init_user": "   Benutzer: {user}",
     "deploy.init_path": "   Pfad: {path}",
     "deploy.init_docker_context": "   Docker Context: {context}",
+    "deploy.init_image": "   Image: {image}",
     "deploy.prompt_host": "Server-IP oder Hostname",
     "deploy.init_gitignore": (
         "Hinweis: .aegis/ in .gitignore aufnehmen, um Deploy-Konfiguration nicht zu committen"
@@ -791,12 +793,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "Altes Backup entfernt: {name}",
     "deploy.no_existing": "Kein vorhandenes Deployment gefunden, überspringe Backup",
     "deploy.syncing": "Synchronisiere Dateien zum Server...",
-    "deploy.mkdir_failed": "Remote-Verzeichnis '{path}' konnte nicht erstellt werden",
     "deploy.sync_failed": "Dateisynchronisierung fehlgeschlagen",
+    "deploy.image_push_failed": "Image {image} konnte nicht gebaut und gepusht werden",
     "deploy.copying_env": "Kopiere {file} als .env auf den Server...",
     "deploy.env_copy_failed": "Kopieren der .env-Datei fehlgeschlagen",
-    "deploy.stopping": "Stoppe laufende Services...",
     "deploy.building": "Baue und starte Services auf dem Server...",
+    "deploy.pushing_image": "Baue und pushe {image} lokal...",
     "deploy.start_failed": "Services konnten nicht gestartet werden",
     "deploy.auto_rollback": "Automatischer Rollback auf vorherige Version...",
     "deploy.health_waiting": "Warte auf Container-Stabilisierung...",
@@ -909,10 +911,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "Server-IP-Adresse oder Hostname",
     "deploy.help_opt_user": "SSH-Benutzer für das Deployment",
     "deploy.help_opt_path": "Deployment-Pfad auf dem Server",
+    "deploy.help_opt_registry": "Registry für Images; der Server zieht statt zu bauen (z. B. ghcr.io/acme)",
     "deploy.help_opt_public_key": "Pfad zu einem öffentlichen Schlüssel, der in die authorized_keys des Deploy-Benutzers eingetragen wird (idempotent). Damit entfällt das manuelle ssh-copy-id vor dem Deployment.",
     "deploy.help_opt_build": "Images vor dem Deployment bauen",
     "deploy.help_opt_backup": "Vor dem Deployment ein Backup erstellen",
     "deploy.help_opt_health": "Nach dem Deployment einen Health-Check ausführen",
+    "deploy.help_opt_recreate": "Alle Container neu erstellen statt nur die geänderten",
     "deploy.help_opt_rolling": (
         "Code-only Deployment ohne HTTP-Downtime. Rollt den Webserver per "
         "docker-rollout und pausiert die Worker-Queue, damit laufende "
@@ -698,11 +698,15 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "No deploy configuration found. Run 'aegis deploy-init' first."
     ),
+    "deploy.config_invalid": (
+        "{file} is missing required keys: {keys}. Fix it or re-run aegis deploy-init."
+    ),
     "deploy.init_saved": ("Deploy configuration saved to {file}"),
     "deploy.init_host": "   Host: {host}",
     "deploy.init_user": "   User: {user}",
     "deploy.init_path": "   Path: {path}",
     "deploy.init_docker_context": "   Docker Context: {context}",
+    "deploy.init_image": "   Image: {image}",
     "deploy.prompt_host": "Server IP or hostname",
     "deploy.init_gitignore": (
         "Note: Consider adding .aegis/ to .gitignore to avoid committing deploy config"
@@ -801,12 +805,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "Pruned old backup: {name}",
     "deploy.no_existing": ("No existing deployment found, skipping backup"),
     "deploy.syncing": "Syncing files to server...",
-    "deploy.mkdir_failed": ("Failed to create remote directory '{path}'"),
     "deploy.sync_failed": "Failed to sync files",
+    "deploy.image_push_failed": "Failed to build and push image {image}",
     "deploy.copying_env": "Copying {file} to server as .env...",
     "deploy.env_copy_failed": "Failed to copy .env file",
-    "deploy.stopping": "Stopping existing services...",
     "deploy.building": "Building and starting services on server...",
+    "deploy.pushing_image": "Building and pushing {image} locally...",
     "deploy.start_failed": "Failed to start services",
     "deploy.auto_rollback": "Auto-rolling back to previous version...",
     "deploy.health_waiting": "Waiting for containers to stabilize...",
@@ -946,6 +950,10 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "Server IP address or hostname",
     "deploy.help_opt_user": "SSH user for deployment",
     "deploy.help_opt_path": "Deployment path on server",
+    "deploy.help_opt_registry": (
+        "Registry to push images to; the server pulls instead of building "
+        "(e.g. ghcr.io/acme)"
+    ),
     "deploy.help_opt_public_key": (
         "Path to a public key to install in the deploy user's authorized_keys "
         "(idempotent). Use this so you don't have to ssh-copy-id by hand "
@@ -954,6 +962,9 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_build": "Build images before deploying",
     "deploy.help_opt_backup": "Create backup before deploying",
     "deploy.help_opt_health": "Run health check after deploying",
+    "deploy.help_opt_recreate": (
+        "Force-recreate every container instead of only the changed ones"
+    ),
     "deploy.help_opt_rolling": (
         "Zero-HTTP-downtime code-only deploy. Rolls the webserver by "
         "health-polling a new replica and pauses the worker queue so "
@@ -690,11 +690,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "Sin configuración de despliegue. Ejecuta 'aegis deploy-init' primero."
     ),
+    "deploy.config_invalid": "A {file} le faltan claves obligatorias: {keys}. Corrígelo o vuelve a ejecutar aegis deploy-init.",
     "deploy.init_saved": "Configuración de despliegue guardada en {file}",
     "deploy.init_host": "   Host: {host}",
     "deploy.init_user": "   Usuario: {user}",
     "deploy.init_path": "   Ruta: {path}",
     "deploy.init_docker_context": "   Docker Context: {context}",
+    "deploy.init_image": "   Imagen: {image}",
     "deploy.prompt_host": "IP o hostname del servidor",
     "deploy.init_gitignore": (
         "Nota: Considera agregar .aegis/ a .gitignore para evitar confirmar config de despliegue"
@@ -793,12 +795,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "Respaldo antiguo eliminado: {name}",
     "deploy.no_existing": "Sin despliegue existente, omitiendo respaldo",
     "deploy.syncing": "Sincronizando archivos al servidor...",
-    "deploy.mkdir_failed": "Error al crear directorio remoto '{path}'",
     "deploy.sync_failed": "Error al sincronizar archivos",
+    "deploy.image_push_failed": "Error al construir y publicar la imagen {image}",
     "deploy.copying_env": "Copiando {file} al servidor como .env...",
     "deploy.env_copy_failed": "Error al copiar archivo .env",
-    "deploy.stopping": "Deteniendo servicios existentes...",
     "deploy.building": "Construyendo e iniciando servicios en servidor...",
+    "deploy.pushing_image": "Construyendo y publicando {image} localmente...",
     "deploy.start_failed": "Error al iniciar servicios",
     "deploy.auto_rollback": "Revirtiendo automáticamente a versión anterior...",
     "deploy.health_waiting": "Esperando estabilización de contenedores...",
@@ -911,10 +913,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "Dirección IP o nombre de host del servidor",
     "deploy.help_opt_user": "Usuario SSH para el despliegue",
     "deploy.help_opt_path": "Ruta de despliegue en el servidor",
+    "deploy.help_opt_registry": "Registro al que publicar imágenes; el servidor las descarga en lugar de construirlas (p. ej. ghcr.io/acme)",
     "deploy.help_opt_public_key": "Ruta a una clave pública que se instalará en authorized_keys del usuario de despliegue (idempotente). Úsala para no tener que ejecutar ssh-copy-id manualmente antes del despliegue.",
     "deploy.help_opt_build": "Construir las imágenes antes de desplegar",
     "deploy.help_opt_backup": "Crear un respaldo antes de desplegar",
     "deploy.help_opt_health": "Ejecutar comprobación de salud tras desplegar",
+    "deploy.help_opt_recreate": "Recrear todos los contenedores en lugar de solo los modificados",
     "deploy.help_opt_rolling": (
         "Despliegue continuo sin tiempo de inactividad HTTP, solo código. "
         "Rota el servidor web con docker-rollout y pausa la cola del "
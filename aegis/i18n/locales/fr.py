@@ -690,11 +690,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "Aucune configuration de déploiement trouvée. Exécutez « aegis deploy-init » d'abord."
     ),
+    "deploy.config_invalid": "Clés obligatoires manquantes dans {file} : {keys}. Corrigez-le ou relancez aegis deploy-init.",
     "deploy.init_saved": "Configuration de déploiement enregistrée dans {file}",
     "deploy.init_host": "   Hôte : {host}",
     "deploy.init_user": "   Utilisateur : {user}",
     "deploy.init_path": "   Chemin : {path}",
     "deploy.init_docker_context": "   Contexte Docker : {context}",
+    "deploy.init_image": "   Image : {image}",
     "deploy.prompt_host": "IP ou nom d'hôte du serveur",
     "deploy.init_gitignore": (
         "Note : pensez à ajouter .aegis/ dans .gitignore pour ne pas versionner la configuration de déploiement"
@@ -793,12 +795,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "Ancienne sauvegarde supprimée : {name}",
     "deploy.no_existing": "Aucun déploiement existant trouvé, sauvegarde ignorée",
     "deploy.syncing": "Synchronisation des fichiers vers le serveur...",
-    "deploy.mkdir_failed": "Impossible de créer le répertoire distant « {path} »",
     "deploy.sync_failed": "Échec de la synchronisation des fichiers",
+    "deploy.image_push_failed": "Échec de la construction et de l'envoi de l'image {image}",
     "deploy.copying_env": "Copie de {file} vers le serveur en tant que .env...",
     "deploy.env_copy_failed": "Échec de la copie du fichier .env",
-    "deploy.stopping": "Arrêt des services existants...",
     "deploy.building": "Construction et démarrage des services sur le serveur...",
+    "deploy.pushing_image": "Construction et envoi de {image} en local...",
     "deploy.start_failed": "Échec du démarrage des services",
     "deploy.auto_rollback": "Rollback automatique vers la version précédente...",
     "deploy.health_waiting": "Attente de la stabilisation des conteneurs...",
@@ -911,10 +913,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "Adresse IP ou nom d'hôte du serveur",
     "deploy.help_opt_user": "Utilisateur SSH pour le déploiement",
     "deploy.help_opt_path": "Chemin de déploiement sur le serveur",
+    "deploy.help_opt_registry": "Registre où envoyer les images ; le serveur les récupère au lieu de les construire (ex. ghcr.io/acme)",
     "deploy.help_opt_public_key": "Chemin vers une clé publique à installer dans authorized_keys de l'utilisateur de déploiement (idempotent). Utilisez-le pour éviter de lancer ssh-copy-id à la main avant le déploiement.",
     "deploy.help_opt_build": "Construire les images avant le déploiement",
     "deploy.help_opt_backup": "Créer une sauvegarde avant le déploiement",
     "deploy.help_opt_health": "Exécuter un contrôle de santé après le déploiement",
+    "deploy.help_opt_recreate": "Recréer tous les conteneurs au lieu des seuls conteneurs modifiés",
     "deploy.help_opt_rolling": (
         "Déploiement code-only sans interruption HTTP. Roule le serveur "
         "web via docker-rollout et met en pause la file des workers pour "
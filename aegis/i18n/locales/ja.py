@@ -672,11 +672,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "デプロイ設定が見つかりません。先に 'aegis deploy-init' を実行してください。"
     ),
+    "deploy.config_invalid": "{file} に必須キーがありません：{keys}。修正するか aegis deploy-init を再実行してください。",
     "deploy.init_saved": "デプロイ設定を保存：{file}",
     "deploy.init_host": "   ホスト：{host}",
     "deploy.init_user": "   ユーザー：{user}",
     "deploy.init_path": "   パス：{path}",
     "deploy.init_docker_context": "   Docker コンテキスト：{context}",
+    "deploy.init_image": "   イメージ：{image}",
     "deploy.prompt_host": "サーバーの IP またはホスト名",
     "deploy.init_gitignore": (
         "注意：デプロイ設定のコミットを避けるため .aegis/ を .gitignore に追加検討してください"
@@ -775,12 +777,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "古いバックアップを削除：{name}",
     "deploy.no_existing": "既存のデプロイが見つかりません、バックアップをスキップ",
     "deploy.syncing": "ファイルをサーバーに同期中...",
-    "deploy.mkdir_failed": "リモートディレクトリ '{path}' の作成失敗",
     "deploy.sync_failed": "ファイル同期失敗",
+    "deploy.image_push_failed": "イメージ {image} のビルドとプッシュに失敗",
     "deploy.copying_env": "{file} を .env としてサーバーにコピー中...",
     "deploy.env_copy_failed": ".env ファイルのコピー失敗",
-    "deploy.stopping": "既存サービスを停止中...",
     "deploy.building": "サーバーでサービスをビルド＆起動中...",
+    "deploy.pushing_image": "{image} をローカルでビルドしてプッシュ中...",
     "deploy.start_failed": "サービスの起動失敗",
     "deploy.auto_rollback": "前のバージョンに自動ロールバック中...",
     "deploy.health_waiting": "コンテナの安定化を待機中...",
@@ -892,10 +894,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "サーバーの IP アドレスまたはホスト名",
     "deploy.help_opt_user": "デプロイに使用する SSH ユーザー",
     "deploy.help_opt_path": "サーバー上のデプロイパス",
+    "deploy.help_opt_registry": "イメージのプッシュ先レジストリ。サーバーはビルドせずにプル（例: ghcr.io/acme）",
     "deploy.help_opt_public_key": "デプロイユーザーの authorized_keys に追加する公開鍵のパス（冪等）。これによりデプロイ前に手動で ssh-copy-id を実行する必要がなくなります。",
     "deploy.help_opt_build": "デプロイ前にイメージをビルド",
     "deploy.help_opt_backup": "デプロイ前にバックアップを作成",
     "deploy.help_opt_health": "デプロイ完了後にヘルスチェックを実行",
+    "deploy.help_opt_recreate": "変更されたコンテナだけでなく全コンテナを再作成",
     "deploy.help_opt_rolling": (
         "HTTPダウンタイムなしのコードのみデプロイ。docker-rollout で "
         "Webサーバーをロールし、ワーカーキューを一時停止して実行中の "
@@ -649,11 +649,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "배포 구성을 찾을 수 없음. 먼저 'aegis deploy-init'을 실행하세요."
     ),
+    "deploy.config_invalid": "{file}에 필수 키가 없습니다: {keys}. 수정하거나 aegis deploy-init을 다시 실행하세요.",
     "deploy.init_saved": "배포 구성 저장 완료: {file}",
     "deploy.init_host": "   호스트: {host}",
     "deploy.init_user": "   사용자: {user}",
     "deploy.init_path": "   경로: {path}",
     "deploy.init_docker_context": "   Docker 컨텍스트: {context}",
+    "deploy.init_image": "   이미지: {image}",
     "deploy.prompt_host": "서버 IP 또는 호스트명",
     "deploy.init_gitignore": (
         "참고: 배포 구성 커밋 방지를 위해 .aegis/를 .gitignore에 추가하세요"
@@ -750,12 +752,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "오래된 백업 정리됨: {name}",
     "deploy.no_existing": "기존 배포를 찾을 수 없음, 백업 건너뜀",
     "deploy.syncing": "서버에 파일 동기화 중...",
-    "deploy.mkdir_failed": "원격 디렉토리 '{path}' 생성 실패",
     "deploy.sync_failed": "파일 동기화 실패",
+    "deploy.image_push_failed": "이미지 {image} 빌드 및 푸시 실패",
     "deploy.copying_env": "{file}을(를) 서버에 .env로 복사 중...",
     "deploy.env_copy_failed": ".env 파일 복사 실패",
-    "deploy.stopping": "기존 서비스 중지 중...",
     "deploy.building": "서버에서 서비스 빌드 및 시작 중...",
+    "deploy.pushing_image": "{image} 로컬 빌드 및 푸시 중...",
     "deploy.start_failed": "서비스 시작 실패",
     "deploy.auto_rollback": "이전 버전으로 자동 롤백 중...",
     "deploy.health_waiting": "컨테이너 안정화 대기 중...",
@@ -860,10 +862,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "서버 IP 주소 또는 호스트명",
     "deploy.help_opt_user": "배포에 사용할 SSH 사용자",
     "deploy.help_opt_path": "서버상의 배포 경로",
+    "deploy.help_opt_registry": "이미지를 푸시할 레지스트리, 서버는 빌드 대신 풀 (예: ghcr.io/acme)",
     "deploy.help_opt_public_key": "배포 사용자 authorized_keys에 추가할 공개 키 경로 (멱등 작업). 이 옵션을 사용하면 배포 전에 ssh-copy-id를 직접 실행할 필요가 없습니다.",
     "deploy.help_opt_build": "배포 전에 이미지를 빌드",
     "deploy.help_opt_backup": "배포 전에 백업 생성",
     "deploy.help_opt_health": "배포 후 헬스 체크 실행",
+    "deploy.help_opt_recreate": "변경된 컨테이너만이 아니라 모든 컨테이너를 강제로 재생성",
     "deploy.help_opt_rolling": (
         "HTTP 다운타임 없는 코드 전용 배포. docker-rollout으로 "
         "웹서버를 롤링하고 워커 큐를 일시중지해 진행 중인 작업이 "
@@ -662,11 +662,13 @@ MESSAGES: dict[str, str] = {
     "deploy.no_config": (
         "Конфигурация деплоя не найдена. Выполните «aegis deploy-init» сначала."
     ),
+    "deploy.config_invalid": "В {file} отсутствуют обязательные ключи: {keys}. Исправьте файл или заново выполните aegis deploy-init.",
     "deploy.init_saved": "Конфигурация деплоя сохранена в {file}",
     "deploy.init_host": "   Хост: {host}",
     "deploy.init_user": "   Пользователь: {user}",
     "deploy.init_path": "   Путь: {path}",
     "deploy.init_docker_context": "   Docker Context: {context}",
+    "deploy.init_image": "   Образ: {image}",
     "deploy.prompt_host": "IP-адрес или имя сервера",
     "deploy.init_gitignore": (
         "Примечание: добавьте .aegis/ в .gitignore, чтобы не коммитить конфиг деплоя"
@@ -761,12 +763,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "Удалён старый бэкап: {name}",
     "deploy.no_existing": "Предыдущее развёртывание не найдено, бэкап пропущен",
     "deploy.syncing": "Синхронизация файлов на сервер...",
-    "deploy.mkdir_failed": "Не удалось создать каталог «{path}» на сервере",
     "deploy.sync_failed": "Не удалось синхронизировать файлы",
+    "deploy.image_push_failed": "Не удалось собрать и отправить образ {image}",
     "deploy.copying_env": "Копирование {file} на сервер как .env...",
     "deploy.env_copy_failed": "Не удалось скопировать файл .env",
-    "deploy.stopping": "Остановка сервисов...",
     "deploy.building": "Сборка и запуск сервисов на сервере...",
+    "deploy.pushing_image": "Локальная сборка и отправка {image}...",
     "deploy.start_failed": "Не удалось запустить сервисы",
     "deploy.auto_rollback": "Автоматический откат к предыдущей версии...",
     "deploy.health_waiting": "Ожидание стабилизации контейнеров...",
@@ -876,10 +878,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "IP-адрес или имя хоста сервера",
     "deploy.help_opt_user": "SSH-пользователь для деплоя",
     "deploy.help_opt_path": "Путь деплоя на сервере",
+    "deploy.help_opt_registry": "Реестр для образов; сервер скачивает их вместо сборки (например, ghcr.io/acme)",
     "deploy.help_opt_public_key": "Путь к публичному ключу, который будет добавлен в authorized_keys пользователя деплоя (идемпотентно). Позволяет не запускать ssh-copy-id вручную перед деплоем.",
     "deploy.help_opt_build": "Собрать образы перед деплоем",
     "deploy.help_opt_backup": "Создать бэкап перед деплоем",
     "deploy.help_opt_health": "Выполнить проверку работоспособности после деплоя",
+    "deploy.help_opt_recreate": "Пересоздать все контейнеры, а не только изменённые",
     "deploy.help_opt_rolling": (
         "Развёртывание только кода без HTTP-простоя. Перекатывает "
         "веб-сервер через docker-rollout и приостанавливает очередь "
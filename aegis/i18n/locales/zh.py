@@ -538,11 +538,13 @@ MESSAGES: dict[str, str] = {
     "ingress.next_certs": "   证书将在首次访问时自动签发",
     # ── deploy 命令 ─────────────────────────────────────────────────────
     "deploy.no_config": ("未找到部署配置，请先执行 aegis deploy-init。"),
+    "deploy.config_invalid": "{file} 缺少必需的键：{keys}。请修正或重新执行 aegis deploy-init。",
     "deploy.init_saved": "部署配置已保存至 {file}",
     "deploy.init_host": "   主机：{host}",
     "deploy.init_user": "   用户：{user}",
     "deploy.init_path": "   路径：{path}",
     "deploy.init_docker_context": "   Docker 上下文：{context}",
+    "deploy.init_image": "   镜像：{image}",
     "deploy.prompt_host": "服务器 IP 或主机名",
     "deploy.init_gitignore": (
         "提示：建议将 .aegis/ 添加到 .gitignore，避免提交部署配置"
@@ -637,12 +639,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "已清理旧备份：{name}",
     "deploy.no_existing": "未找到已有部署，跳过备份",
     "deploy.syncing": "正在同步文件到服务器……",
-    "deploy.mkdir_failed": "创建远程目录「{path}」失败",
     "deploy.sync_failed": "文件同步失败",
+    "deploy.image_push_failed": "构建并推送镜像 {image} 失败",
     "deploy.copying_env": "正在将 {file} 上传为服务器环境变量文件（.env）……",
     "deploy.env_copy_failed": "复制 .env 文件失败",
-    "deploy.stopping": "正在停止现有服务……",
     "deploy.building": "正在构建并启动服务……",
+    "deploy.pushing_image": "正在本地构建并推送 {image}……",
     "deploy.start_failed": "启动服务失败",
     "deploy.auto_rollback": "正在自动回滚到上一版本……",
     "deploy.health_waiting": "等待容器稳定……",
@@ -747,10 +749,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "服务器 IP 地址或主机名",
     "deploy.help_opt_user": "部署时使用的 SSH 用户",
     "deploy.help_opt_path": "服务器上的部署路径",
+    "deploy.help_opt_registry": "推送镜像的仓库；服务器改为拉取而非构建（例如 ghcr.io/acme）",
     "deploy.help_opt_public_key": "要写入部署用户 authorized_keys 的公钥路径（操作幂等）。使用此选项可免去部署前手动执行 ssh-copy-id。",
     "deploy.help_opt_build": "部署前先构建镜像",
     "deploy.help_opt_backup": "部署前先创建备份",
     "deploy.help_opt_health": "部署完成后执行健康检查",
+    "deploy.help_opt_recreate": "强制重建所有容器，而不仅是已变更的容器",
     "deploy.help_opt_rolling": (
         "仅代码、HTTP 零停机部署。通过 docker-rollout 滚动更新 Web "
         "服务器，并暂停 worker 队列，让在途任务平稳收尾。跳过数据库 "
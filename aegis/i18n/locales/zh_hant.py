@@ -538,11 +538,13 @@ MESSAGES: dict[str, str] = {
     "ingress.next_certs": "   證書將在首次訪問時自動籤發",
     # ── deploy 命令 ─────────────────────────────────────────────────────
     "deploy.no_config": ("未找到部署設定，請先執行 aegis deploy-init。"),
+    "deploy.config_invalid": "{file} 缺少必要的鍵：{keys}。請修正或重新執行 aegis deploy-init。",
     "deploy.init_saved": "部署設定已保存至 {file}",
     "deploy.init_host": "   主機：{host}",
     "deploy.init_user": "   用戶：{user}",
     "deploy.init_path": "   路徑：{path}",
     "deploy.init_docker_context": "   Docker 上下文：{context}",
+    "deploy.init_image": "   映像：{image}",
     "deploy.prompt_host": "服務器 IP 或主機名",
     "deploy.init_gitignore": (
         "提示：建議將 .aegis/ 添加到 .gitignore，避免提交部署設定"
@@ -637,12 +639,12 @@ MESSAGES: dict[str, str] = {
     "deploy.backup_pruned": "已清理舊備份：{name}",
     "deploy.no_existing": "未找到已有部署，跳過備份",
     "deploy.syncing": "正在同步檔案到服務器……",
-    "deploy.mkdir_failed": "創建遠程目錄「{path}」失敗",
     "deploy.sync_failed": "檔案同步失敗",
+    "deploy.image_push_failed": "建置並推送映像 {image} 失敗",
     "deploy.copying_env": "正在將 {file} 上傳為服務器環境變量檔案（.env）……",
     "deploy.env_copy_failed": "復制 .env 檔案失敗",
-    "deploy.stopping": "正在停止現有服務……",
     "deploy.building": "正在構建並啟動服務……",
+    "deploy.pushing_image": "正在本機建置並推送 {image}……",
     "deploy.start_failed": "啟動服務失敗",
     "deploy.auto_rollback": "正在自動回滾到上一版本……",
     "deploy.health_waiting": "等待容器穩定……",
@@ -747,10 +749,12 @@ MESSAGES: dict[str, str] = {
     "deploy.help_opt_host": "伺服器 IP 位址或主機名稱",
     "deploy.help_opt_user": "部署使用的 SSH 使用者",
     "deploy.help_opt_path": "伺服器上的部署路徑",
+    "deploy.help_opt_registry": "推送映像的倉庫；伺服器改為拉取而非建置（例如 ghcr.io/acme）",
     "deploy.help_opt_public_key": "要寫入部署使用者 authorized_keys 的公鑰路徑（操作具冪等性）。使用此選項可省去部署前手動執行 ssh-copy-id。",
     "deploy.help_opt_build": "部署前先建構映像",
     "deploy.help_opt_backup": "部署前先建立備份",
     "deploy.help_opt_health": "部署完成後執行健康檢查",
+    "deploy.help_opt_recreate": "強制重建所有容器，而不僅是已變更的容器",
     "deploy.help_opt_rolling": (
         "僅程式碼、HTTP 零停機部署。透過 docker-rollout 滾動更新 Web "
         "伺服器，並暫停 worker 佇列，讓在途任務平穩收尾。跳過資料庫 "
@@ -16,6 +16,7 @@ from aegis.cli.interactive import (
     get_ai_backend_selection,
     get_ai_provider_selection,
     interactive_project_selection,
+    set_ai_service_config,
     set_database_engine_selection,
 )
 
@@ -378,9 +379,7 @@ class TestAIConfigurationIntegration:
         clear_ai_provider_selection()
 
         # Simulate provider selection
-        from aegis.cli.interactive import _ai_provider_selection
-
-        _ai_provider_selection["ai"] = ["openai", "google", "groq"]
+        set_ai_service_config("ai", providers=["openai", "google", "groq"])
 
         # Verify retrieval
         providers = get_ai_provider_selection("ai")
@@ -401,9 +400,7 @@ class TestAIConfigurationIntegration:
     def test_clear_provider_selection(self) -> None:
         """Test clearing provider selection."""
         # Set some providers
-        from aegis.cli.interactive import _ai_provider_selection
-
-        _ai_provider_selection["ai"] = ["openai"]
+        set_ai_service_config("ai", providers=["openai"])
 
         # Verify they're set
         providers = get_ai_provider_selection("ai")
@@ -420,12 +417,11 @@ class TestTemplateGeneratorIntegration:
 
     def test_ai_providers_string_generation(self) -> None:
         """Test that template generator creates correct provider string."""
-        from aegis.cli.interactive import _ai_provider_selection
         from aegis.core.template_generator import TemplateGenerator
 
         # Set up provider selection
         clear_ai_provider_selection()
-        _ai_provider_selection["ai"] = ["openai", "anthropic", "google"]
+        set_ai_service_config("ai", providers=["openai", "anthropic", "google"])
 
         # Create template generator with AI service
         generator = TemplateGenerator(
@@ -453,12 +449,11 @@ class TestTemplateGeneratorIntegration:
 
     def test_template_context_includes_providers(self) -> None:
         """Test that template context includes AI provider selection."""
-        from aegis.cli.interactive import _ai_provider_selection
         from aegis.core.template_generator import TemplateGenerator
 
         # Set up provider selection
         clear_ai_provider_selection()
-        _ai_provider_selection["ai"] = ["groq", "google", "mistral"]
+        set_ai_service_config("ai", providers=["groq", "google", "mistral"])
 
         # Create template generator with AI service
         generator = TemplateGenerator(
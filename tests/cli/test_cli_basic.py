@@ -5,9 +5,18 @@ These tests focus on command parsing, help text, and basic functionality
 without doing full project generation.
 """
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
-from .test_utils import run_aegis_command, run_cli_help_command, strip_ansi_codes
+from .test_utils import (
+    PROJECT_ROOT,
+    run_aegis_command,
+    run_cli_help_command,
+    strip_ansi_codes,
+)
 
 
 class TestCLIBasics:
@@ -176,3 +185,94 @@ class TestComponentValidation:
             or "Auto-detected: Scheduler with sqlite persistence" in result.stderr
             or "📊 Auto-detected: Scheduler with sqlite persistence" in result.stderr
         )
+
+
+class TestLazyCommandLoading:
+    """Core commands are imported only when Click resolves them."""
+
+    @staticmethod
+    def _modules_loaded_by(*args: str) -> set[str]:
+        """Run ``aegis *args`` in a fresh interpreter; return loaded modules."""
+        script = (
+            "import sys\n"
+            "from aegis.__main__ import app\n"
+            f"try:\n    app({list(args)!r})\n"
+            "except SystemExit:\n    pass\n"
+            "print('\\n'.join(sys.modules), file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return set(result.stderr.splitlines())
+
+    def test_version_skips_unrelated_command_modules(self) -> None:
+        loaded = self._modules_loaded_by("version")
+        assert "aegis.commands.version" in loaded
+        assert "aegis.commands.deploy" not in loaded
+        assert "aegis.commands.init" not in loaded
+        assert "copier" not in loaded
+
+    @pytest.mark.parametrize("command", ["init", "add", "update", "plugins"])
+    def test_non_deploy_commands_skip_deploy_module(self, command: str) -> None:
+        loaded = self._modules_loaded_by(command, "--help")
+        assert "aegis.commands.deploy" not in loaded
+
+    def test_deploy_commands_share_one_lazy_module(self) -> None:
+        loaded = self._modules_loaded_by("deploy-status", "--help")
+        assert "aegis.commands.deploy" in loaded
+        assert "aegis.commands.init" not in loaded
+
+    def test_add_service_help_skips_heavy_dependencies(self) -> None:
+        loaded = self._modules_loaded_by("add-service", "--help")
+        assert "aegis.commands.add_service" in loaded
+        assert "copier" not in loaded
+        assert "jinja2" not in loaded
+        assert "yaml" not in loaded
+
+    def test_non_copier_project_fails_without_importing_copier(
+        self, tmp_path: Path
+    ) -> None:
+        loaded = self._modules_loaded_by("add-service", "auth", "-p", str(tmp_path))
+        assert "aegis.commands.add_service" in loaded
+        assert "copier" not in loaded
+
+    def test_unknown_command_suggests_lazy_names(self) -> None:
+        result = run_aegis_command("ini")
+        assert not result.success
+        assert "Did you mean 'init'?" in result.stderr + result.stdout
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_flag_combines_with_global_options(self, flag: str) -> None:
+        # The fast path only handles the bare flag; the Typer path must
+        # accept the same flag alongside other global options.
+        result = run_aegis_command("--verbose", flag)
+        assert result.success, result.stderr
+        assert result.stdout.startswith("Aegis Stack CLI v")
+
+    def test_version_flag_listed_in_help(self) -> None:
+        result = run_aegis_command("--help")
+        clean_output = strip_ansi_codes(result.stdout)
+        assert "--version" in clean_output
+        assert "-V" in clean_output
+
+    def test_version_fast_path_skips_typer(self) -> None:
+        script = (
+            "import runpy, sys\n"
+            "sys.argv = ['aegis', '--version']\n"
+            "try:\n    runpy.run_module('aegis', run_name='__main__')\n"
+            "except SystemExit:\n    pass\n"
+            "print('typer' in sys.modules, file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.stdout.startswith("Aegis Stack CLI v")
+        assert result.stderr.strip() == "False"
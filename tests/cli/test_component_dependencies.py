@@ -11,6 +11,7 @@ Tests the core logic in aegis.core.dependency_resolver and ensures
 component combinations work as expected.
 """
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -212,6 +213,21 @@ def test_dependency_resolution_order() -> None:
     assert redis_index < worker_index, "Redis should come before worker"
 
 
+def test_dependency_resolution_order_is_not_alphabetical(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requirements come first even when they sort after their dependent."""
+    monkeypatch.setitem(
+        COMPONENTS,
+        "database",
+        replace(COMPONENTS["database"], required_components=["scheduler"]),
+    )
+
+    resolved = DependencyResolver.resolve_dependencies(["database", "redis"])
+
+    assert resolved == ["redis", "scheduler", "database"]
+
+
 def test_circular_dependency_detection() -> None:
     """Test that circular dependencies are detected (if any exist)."""
     # Current components don't have circular dependencies, but test the logic
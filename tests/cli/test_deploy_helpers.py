@@ -15,20 +15,32 @@ import subprocess
 from pathlib import Path
 
 import pytest
+import typer
 import yaml
 
 from aegis.commands import deploy as deploy_mod
 from aegis.commands.deploy import (
     ROLLING_ROLLOUT_TIMEOUT_DEFAULT,
+    _build_and_push_image,
+    _compose_prefix,
     _create_backup,
     _detect_github_repo,
+    _get_project_root,
+    _git_file_list,
+    _image_repository,
+    _image_tag,
     _is_neon_database,
+    _load_deploy_config,
     _project_python_minor,
+    _registry_image,
     _render_deploy_workflow,
+    _restart_services_command,
     _rollback_to_backup,
     _rolling_health_verdict,
     _rolling_inspect_health_command,
     _rolling_scale_command,
+    _rsync_cmd,
+    _ssh_cmd,
 )
 
 
@@ -113,6 +125,240 @@ def test_render_deploy_workflow_references_required_secrets() -> None:
     assert "${{ secrets.DEPLOY_HOST }}" in out
 
 
+def test_get_project_root_walks_up_to_pyproject(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    nested = tmp_path / "app" / "core"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+    assert _get_project_root() == tmp_path
+    # An explicit path always wins over the cwd-based walk.
+    assert _get_project_root(str(nested)) == nested
+
+
+def _write_deploy_config(root: Path, body: str) -> None:
+    (root / ".aegis").mkdir()
+    (root / ".aegis" / "deploy.yml").write_text(body)
+
+
+def test_load_deploy_config_returns_valid_config(tmp_path: Path) -> None:
+    _write_deploy_config(
+        tmp_path, "server:\n  host: h\n  user: root\n  path: /opt/app\n"
+    )
+    config = _load_deploy_config(str(tmp_path))
+    assert config is not None
+    assert config["server"]["host"] == "h"
+
+
+def test_load_deploy_config_treats_empty_file_as_missing(tmp_path: Path) -> None:
+    _write_deploy_config(tmp_path, "")
+    assert _load_deploy_config(str(tmp_path)) is None
+
+
+def test_load_deploy_config_fails_fast_on_missing_server_keys(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # A typo'd key used to surface as a KeyError deep inside a subcommand.
+    _write_deploy_config(tmp_path, "server:\n  hots: h\n  user: root\n")
+    with pytest.raises(typer.Exit):
+        _load_deploy_config(str(tmp_path))
+    err = capsys.readouterr().err
+    assert "server.host" in err
+    assert "server.path" in err
+    assert "server.user" not in err
+
+
+def test_git_file_list_lists_tracked_and_unignored_files(tmp_path: Path) -> None:
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    (tmp_path / ".gitignore").write_text("node_modules/\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "big.js").write_text("x")
+    (tmp_path / "app.py").write_text("x")
+    files = _git_file_list(tmp_path)
+    assert files is not None
+    assert set(files.split(b"\0")) - {b""} == {b".gitignore", b"app.py"}
+
+
+def test_git_file_list_drops_deleted_tracked_files(tmp_path: Path) -> None:
+    git = ["git", "-C", str(tmp_path)]
+    subprocess.run([*git, "init", "-q"], check=True)
+    (tmp_path / "kept.py").write_text("x")
+    (tmp_path / "gone.py").write_text("x")
+    subprocess.run([*git, "add", "."], check=True)
+    (tmp_path / "gone.py").unlink()
+    files = _git_file_list(tmp_path)
+    assert files is not None
+    assert set(files.split(b"\0")) - {b""} == {b"kept.py"}
+
+
+def test_git_file_list_returns_none_outside_a_repo(tmp_path: Path) -> None:
+    # ``git -C`` on a non-repo path exits non-zero; the caller then walks the tree.
+    assert _git_file_list(tmp_path / "missing") is None
+
+
+def test_rsync_cmd_reads_file_list_from_stdin_and_keeps_excludes() -> None:
+    cmd = _rsync_cmd("h", "u", Path("/src"), "/srv", files_from_stdin=True)
+    assert "--files-from=-" in cmd
+    assert "--from0" in cmd
+    # rsync < 3.1 (macOS) rejects this flag; _git_file_list prunes instead.
+    assert "--ignore-missing-args" not in cmd
+    assert ".env.deploy" in cmd
+
+
+def test_restart_services_command_updates_in_place_then_restarts_traefik() -> None:
+    # No ``down``: compose recreates only changed containers, so unchanged
+    # services like postgres/redis keep running through the deploy.
+    cmd = _restart_services_command("/srv/app", build=True)
+    assert " down" not in cmd
+    assert cmd.index("up -d --remove-orphans --build") < cmd.index("restart traefik")
+    assert "ps traefik --quiet" in cmd
+    assert "--force-recreate" not in cmd
+
+
+def test_restart_services_command_only_fails_on_up() -> None:
+    # A failed ``up`` must surface as a non-zero exit so deploy can roll
+    # back; the Traefik restart stays best-effort.
+    cmd = _restart_services_command("/srv/app", build=False)
+    assert "up -d --remove-orphans || exit $?;" in cmd
+    assert "restart traefik || true" in cmd
+    assert "--build" not in cmd
+
+
+def test_restart_services_command_recreate_forces_every_container() -> None:
+    cmd = _restart_services_command("/srv/app", build=True, recreate=True)
+    assert "up -d --remove-orphans --build --force-recreate" in cmd
+
+
+def test_restart_services_command_with_registry_image_pulls_instead_of_build() -> None:
+    cmd = _restart_services_command(
+        "/srv/app", build=True, image="ghcr.io/acme/app:latest"
+    )
+    assert "AEGIS_STACK_TAG=ghcr.io/acme/app:latest docker compose" in cmd
+    assert cmd.index("pull webserver &&") < cmd.index("up -d --remove-orphans")
+    assert "--build" not in cmd
+
+
+def test_restart_services_command_records_running_image_after_up() -> None:
+    cmd = _restart_services_command("/srv/app", build=True, image="reg/app:abc1234")
+    record = "printf '%s\\n' reg/app:abc1234 > /srv/app/.aegis-image"
+    assert cmd.index("|| exit $?;") < cmd.index(record)
+    # Server-side builds clear a stale marker so rollback rebuilds instead.
+    assert "rm -f /srv/app/.aegis-image" in _restart_services_command(
+        "/srv/app", build=True
+    )
+
+
+def test_image_tag_is_unique_for_dirty_work_trees(tmp_path: Path) -> None:
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    (tmp_path / "app.py").write_text("x")
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+    sha = subprocess.run(
+        [*git, "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    assert _image_tag(tmp_path) == sha
+    # Deploy ships uncommitted edits, so the SHA alone would be reused
+    # for a different image.
+    (tmp_path / "app.py").write_text("y")
+    dirty = _image_tag(tmp_path)
+    assert dirty.startswith(f"{sha}-dirty-")
+    assert dirty != sha
+
+
+def test_image_repository_strips_tag_but_keeps_registry_port() -> None:
+    assert _image_repository("ghcr.io/acme/app") == "ghcr.io/acme/app"
+    assert _image_repository("ghcr.io/acme/app:v1") == "ghcr.io/acme/app"
+    assert _image_repository("reg.local:5000/app") == "reg.local:5000/app"
+    assert _image_repository("app:v1") == "app"
+
+
+def test_build_and_push_image_pushes_immutable_tag_and_latest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(tmp_path),
+            "-c",
+            "user.name=t",
+            "-c",
+            "user.email=t@t",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "init",
+        ],
+        check=True,
+    )
+    sha = subprocess.run(
+        ["git", "-C", str(tmp_path), "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    real_run = subprocess.run
+    docker_calls: list[list[str]] = []
+
+    def fake_run(cmd, *args, **kwargs):
+        if cmd[0] != "docker":
+            return real_run(cmd, *args, **kwargs)
+        docker_calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, returncode=0)
+
+    monkeypatch.setattr(deploy_mod.subprocess, "run", fake_run)
+
+    ref = _build_and_push_image(tmp_path, "ghcr.io/acme/app", None)
+
+    assert ref == f"ghcr.io/acme/app:{sha}"
+    assert ["docker", "push", ref] in docker_calls
+    assert ["docker", "push", "ghcr.io/acme/app:latest"] in docker_calls
+
+
+def test_compose_prefix_quotes_image_override() -> None:
+    assert "AEGIS_STACK_TAG" not in _compose_prefix("/srv/app")
+    prefix = _compose_prefix("/srv/app", "reg.local/my app")
+    assert "&& AEGIS_STACK_TAG='reg.local/my app' docker compose" in prefix
+
+
+def test_registry_image_reads_docker_section() -> None:
+    assert _registry_image({"docker": {"image": "ghcr.io/acme/app"}}) == (
+        "ghcr.io/acme/app"
+    )
+    assert _registry_image({"docker": {"context": "app-remote"}}) is None
+    assert _registry_image({"docker": None}) is None
+    assert _registry_image({}) is None
+
+
+def test_rsync_cmd_folds_remote_mkdir_into_rsync_path() -> None:
+    cmd = _rsync_cmd(
+        "example.com", "deploy", Path("/src"), "/srv/my app", create_dest=True
+    )
+    assert cmd[cmd.index("--rsync-path") + 1] == "mkdir -p '/srv/my app' && rsync"
+    assert cmd[-2:] == ["/src/", "deploy@example.com:/srv/my app/"]
+    assert "--rsync-path" not in _rsync_cmd(
+        "example.com", "deploy", Path("/src"), "/srv"
+    )
+
+
+def test_ssh_cmd_bounds_connect_and_idle_time() -> None:
+    # A dropped network must fail the deploy, not hang on TCP timeouts.
+    cmd = _ssh_cmd("example.com", "deploy", "true")
+    assert "ConnectTimeout=10" in cmd
+    assert "ServerAliveInterval=15" in cmd
+    assert "ServerAliveCountMax=2" in cmd
+    assert "ControlMaster=auto" in cmd
+    assert cmd[-2:] == ["deploy@example.com", "true"]
+
+
 def test_rolling_scale_command_builds_scale_up() -> None:
     # Brings up a 2nd webserver replica alongside the old one without
     # recreating the old container or touching dependencies, so HTTP keeps
@@ -279,3 +525,37 @@ def test_rollback_skips_db_restore_for_neon(
     assert ok is True
     assert not any("psql" in c for c in calls), "neon rollback must not run psql"
     assert not any("db_backup.sql" in c for c in calls)
+
+
+def test_rollback_rebuilds_without_recorded_image(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(deploy_mod, "_run_remote_capture", _record_remote(calls))
+    monkeypatch.setattr(deploy_mod, "_run_remote", _record_remote(calls))
+
+    assert _rollback_to_backup("h", "u", "/srv/app", "2026-01-01_000000", neon=True)
+
+    assert calls[-1].endswith("up -d --build")
+
+
+def test_rollback_pulls_recorded_registry_image(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def fake(host: str, user: str, command: str) -> subprocess.CompletedProcess:
+        calls.append(command)
+        stdout = "ghcr.io/acme/app:abc1234\n" if ".aegis-image" in command else ""
+        return subprocess.CompletedProcess([], returncode=0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(deploy_mod, "_run_remote_capture", fake)
+    monkeypatch.setattr(deploy_mod, "_run_remote", fake)
+
+    assert _rollback_to_backup("h", "u", "/srv/app", "2026-01-01_000000", neon=True)
+
+    assert "/srv/app/backups/2026-01-01_000000/files/.aegis-image" in calls[1]
+    start = calls[-1]
+    assert "AEGIS_STACK_TAG=ghcr.io/acme/app:abc1234 docker compose" in start
+    assert start.index("pull webserver &&") < start.index("up -d")
+    assert "--build" not in start
@@ -16,7 +16,7 @@ There is intentionally no ``plugins install`` — putting bytes on disk is
 ``pip install``; project-configuration lives in ``aegis add`` (#771).
 
 Tests use ``CliRunner`` against the ``plugins_app`` Typer app directly so
-they don't depend on the module-level ``aegis.__main__:app`` state.
+they don't depend on the process-wide ``aegis.cli.app.get_app()`` state.
 """
 
 from __future__ import annotations
@@ -81,10 +81,10 @@ class TestServicesCommand:
     def test_services_command_with_empty_registry(self):
         """Test services command behavior with empty registry."""
         with mock.patch(
-            "aegis.commands.services.get_services_by_type"
-        ) as mock_get_services:
-            # Mock all service types to return empty dict
-            mock_get_services.return_value = {}
+            "aegis.commands.services.group_services_by_type"
+        ) as mock_group_services:
+            # Mock the grouping to return no service types at all
+            mock_group_services.return_value = {}
 
             result = run_aegis_command("services")
 
@@ -250,7 +250,7 @@ class TestInteractiveServiceSelection:
         with (
             patch("typer.confirm") as mock_confirm,
             patch(
-                "aegis.cli.interactive.questionary.select",
+                "questionary.select",
                 return_value=mock_questionary_result,
             ),
         ):
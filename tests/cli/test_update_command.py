@@ -1104,6 +1104,114 @@ class TestAdvanceCopierTracking:
         assert data["_commit"] == "localsha"
 
 
+class TestCommitAnswersFile:
+    """``_commit_answers_file`` commits the answers file before copier runs."""
+
+    @staticmethod
+    def _git(repo: Path, *args: str) -> str:
+        import subprocess
+
+        return subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def _repo(self, tmp_path: Path) -> Path:
+        self._git(tmp_path, "init", "-q")
+        (tmp_path / "README.md").write_text("x")
+        self._git(tmp_path, "add", "README.md")
+        self._git(tmp_path, "commit", "-q", "-m", "init")
+        return tmp_path
+
+    def _commit(self, repo: Path, message: str) -> None:
+        import aegis.commands.update as upd
+
+        with patch.dict(
+            "os.environ",
+            {
+                "GIT_AUTHOR_NAME": "t",
+                "GIT_AUTHOR_EMAIL": "t@t",
+                "GIT_COMMITTER_NAME": "t",
+                "GIT_COMMITTER_EMAIL": "t@t",
+            },
+        ):
+            upd._commit_answers_file(repo, message)
+
+    def test_commits_tracked_answers_file(self, tmp_path: Path) -> None:
+        repo = self._repo(tmp_path)
+        answers = repo / ".copier-answers.yml"
+        answers.write_text("a: 1\n")
+        self._git(repo, "add", ".copier-answers.yml")
+        self._git(repo, "commit", "-q", "-m", "answers")
+        answers.write_text("a: 2\n")
+
+        self._commit(repo, "Update answers")
+
+        assert self._git(repo, "status", "--porcelain") == ""
+        assert self._git(repo, "log", "-1", "--format=%s").strip() == "Update answers"
+
+    def test_commits_untracked_answers_file(self, tmp_path: Path) -> None:
+        """A pathspec commit rejects untracked files; fall back to ``git add``."""
+        repo = self._repo(tmp_path)
+        (repo / ".copier-answers.yml").write_text("a: 1\n")
+
+        self._commit(repo, "Add answers")
+
+        assert self._git(repo, "status", "--porcelain") == ""
+        assert ".copier-answers.yml" in self._git(repo, "ls-files")
+
+    def test_untracked_fallback_ignores_git_message_language(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Git translates its errors; the fallback must not match on them."""
+        import subprocess
+
+        repo = self._repo(tmp_path)
+        (repo / ".copier-answers.yml").write_text("a: 1\n")
+        real_run = subprocess.run
+
+        def localized_run(cmd, *args, **kwargs):
+            result = real_run(cmd, *args, **kwargs)
+            if cmd[:2] == ["git", "commit"] and result.returncode != 0:
+                result.stderr = (
+                    "error: le chemin '.copier-answers.yml' ne correspond "
+                    "à aucun fichier connu de git\n"
+                ).encode()
+            return result
+
+        monkeypatch.setattr(subprocess, "run", localized_run)
+
+        self._commit(repo, "Add answers")
+
+        assert self._git(repo, "status", "--porcelain") == ""
+        assert ".copier-answers.yml" in self._git(repo, "ls-files")
+
+    def test_nothing_to_commit_is_not_an_error(self, tmp_path: Path) -> None:
+        repo = self._repo(tmp_path)
+        (repo / ".copier-answers.yml").write_text("a: 1\n")
+        self._git(repo, "add", ".copier-answers.yml")
+        self._git(repo, "commit", "-q", "-m", "answers")
+
+        self._commit(repo, "No-op")
+
+        assert self._git(repo, "log", "-1", "--format=%s").strip() == "answers"
+
+    def test_aborts_when_answers_file_left_dirty(self, tmp_path: Path) -> None:
+        import typer
+
+        repo = self._repo(tmp_path)
+        hook = repo / ".git" / "hooks" / "pre-commit"
+        hook.write_text("#!/bin/sh\nexit 1\n")
+        hook.chmod(0o755)
+        (repo / ".copier-answers.yml").write_text("a: 1\n")
+
+        with pytest.raises(typer.Exit):
+            self._commit(repo, "Blocked")
+
+
 class TestResolveRefToCommitRemote:
     """``resolve_ref_to_commit_remote`` resolves refs against a remote repo.
 
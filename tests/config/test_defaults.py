@@ -26,34 +26,6 @@ class TestParsePythonVersionBounds:
         assert min_ver == "3.11"
         assert max_ver == "3.14"  # <3.15 → max is 3.14
 
-    def test_parse_with_mock_pyproject(self, tmp_path: Path) -> None:
-        """Test parsing with a mock pyproject.toml file."""
-        # Create mock pyproject.toml
-        pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text(
-            """
-[project]
-name = "test-project"
-version = "1.0.0"
-requires-python = ">=3.12,<3.15"
-"""
-        )
-
-        # This test verifies the parsing logic works, even though
-        # the function currently only reads from aegis-stack's pyproject.toml
-        # We're testing the parsing logic itself is correct
-        content = pyproject.read_text()
-        for line in content.splitlines():
-            if "requires-python" in line and ">=" in line:
-                spec = line.split("=", 1)[1].strip().strip('"')
-                lower = spec.split(">=")[1].split(",")[0].strip()
-                upper_spec = spec.split("<")[1].strip()
-                major, minor = upper_spec.split(".")
-                upper = f"{major}.{int(minor) - 1}"
-
-                assert lower == "3.12"
-                assert upper == "3.14"  # <3.15 → max is 3.14
-
     def test_parse_fallback_on_missing_file(self) -> None:
         """Test graceful fallback when pyproject.toml is missing."""
         # The function should never fail - it has fallback logic
@@ -66,13 +38,33 @@ requires-python = ">=3.12,<3.15"
         assert min_ver == "3.11"
         assert max_ver == "3.14"
 
-    def test_parse_handles_no_upper_bound(self) -> None:
+    def test_parse_handles_no_upper_bound(self, tmp_path: Path) -> None:
         """Test parsing when there's no upper bound specified."""
-        # If we had requires-python = ">=3.11" (no <X.XX)
-        # The function should fallback to using lower bound as upper bound
-        # We can't easily mock this without modifying the actual file,
-        # but we can verify the logic by checking the code path exists
-        assert True  # Logic verified by code inspection
+        # requires-python = ">=3.11" (no <X.XX) uses the lower bound as upper
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nrequires-python = ">=3.12"\n')
+
+        assert _parse_python_version_bounds(pyproject) == ("3.12", "3.12")
+
+    def test_parse_explicit_pyproject_path(self, tmp_path: Path) -> None:
+        """Test parsing a pyproject.toml passed in explicitly."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nname = "x"\nrequires-python = ">=3.12,<3.15"\n'
+        )
+
+        assert _parse_python_version_bounds(pyproject) == ("3.12", "3.14")
+
+    def test_parse_fallback_without_requires_python(self, tmp_path: Path) -> None:
+        """Test fallback when pyproject.toml lacks requires-python."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "x"\n')
+
+        assert _parse_python_version_bounds(pyproject) == ("3.11", "3.14")
+        assert _parse_python_version_bounds(tmp_path / "missing.toml") == (
+            "3.11",
+            "3.14",
+        )
 
 
 class TestGenerateSupportedVersions:
@@ -134,6 +126,14 @@ class TestConfigurationConstants:
         """Test SUPPORTED_PYTHON_VERSIONS is a list."""
         assert isinstance(SUPPORTED_PYTHON_VERSIONS, list)
 
+    def test_supported_python_versions_not_shared_between_importers(self) -> None:
+        """Mutating one importer's list must not leak into the next import."""
+        from aegis.config import defaults
+
+        mine = defaults.SUPPORTED_PYTHON_VERSIONS
+        mine.append("9.9")
+        assert "9.9" not in defaults.SUPPORTED_PYTHON_VERSIONS
+
     def test_supported_python_versions_not_empty(self) -> None:
         """Test SUPPORTED_PYTHON_VERSIONS is not empty."""
         assert len(SUPPORTED_PYTHON_VERSIONS) > 0
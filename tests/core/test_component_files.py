@@ -8,6 +8,7 @@ from aegis.core.component_files import (
     PROJECT_SLUG_PLACEHOLDER,
     _is_skippable_template_file,
     get_component_files,
+    get_copier_defaults,
     get_template_path,
 )
 
@@ -65,3 +66,16 @@ class TestGetComponentFilesSkipsStrayArtefacts:
         assert not any(f.endswith(".pyc") for f in files)
         # Sanity: the real worker sources are still discovered.
         assert any(f.endswith("heartbeat.py") for f in files)
+
+
+class TestGetCopierDefaults:
+    """copier.yml is parsed once; callers get independent copies."""
+
+    def test_returns_fresh_copy_each_call(self) -> None:
+        first = get_copier_defaults()
+        first["ollama_mode"] = "mutated"
+        first["not_a_copier_key"] = True
+
+        second = get_copier_defaults()
+        assert second.get("ollama_mode") != "mutated"
+        assert "not_a_copier_key" not in second
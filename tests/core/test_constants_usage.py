@@ -57,9 +57,9 @@ def test_infrastructure_order_matches_registry() -> None:
     from aegis.constants import ComponentNames
     from aegis.core.components import COMPONENTS, ComponentType
 
-    derived = [
+    derived = tuple(
         name for name, spec in COMPONENTS.items() if spec.type != ComponentType.CORE
-    ]
+    )
     assert derived == ComponentNames.INFRASTRUCTURE_ORDER, (
         "ComponentNames.INFRASTRUCTURE_ORDER drifted from the COMPONENTS "
         f"registry.\n  registry: {derived}\n  constant: "
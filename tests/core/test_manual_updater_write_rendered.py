@@ -0,0 +1,43 @@
+"""Tests for ``ManualUpdater._write_rendered`` skipping identical rewrites."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from aegis.core.manual_updater import ManualUpdater
+
+
+def _bare_updater(project: Path) -> ManualUpdater:
+    updater = ManualUpdater.__new__(ManualUpdater)
+    updater.project_path = project
+    return updater
+
+
+def test_identical_render_leaves_file_untouched(tmp_path: Path) -> None:
+    # Regenerating for an unrelated answer change must not bump mtimes, or
+    # every editor / dev-server watcher on the project fires.
+    target = tmp_path / "docker-compose.yml"
+    target.write_text("services: {}\n")
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+
+    _bare_updater(tmp_path)._write_rendered(target, "services: {}\n")
+
+    assert target.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_changed_render_is_written(tmp_path: Path) -> None:
+    target = tmp_path / "docker-compose.yml"
+    target.write_text("services: {}\r\n")
+
+    _bare_updater(tmp_path)._write_rendered(target, "services: {}\n")
+
+    assert target.read_bytes() == b"services: {}\n"
+
+
+def test_missing_file_is_created(tmp_path: Path) -> None:
+    target = tmp_path / ".env.example"
+
+    _bare_updater(tmp_path)._write_rendered(target, "PORT=8000\n")
+
+    assert target.read_text() == "PORT=8000\n"
@@ -332,13 +332,13 @@ class TestCliCacheReservedFilter:
 
 class TestMountPluginCliApps:
     """``_mount_plugin_cli_apps`` is the integration seam between
-    ``aegis.__main__`` and ``plugin_discovery``. Tests use a fresh Typer
+    ``aegis.cli.app`` and ``plugin_discovery``. Tests use a fresh Typer
     app to verify the mount call path without depending on the
-    module-level ``aegis.__main__:app`` state.
+    process-wide ``get_app()`` state.
     """
 
     def test_mounts_plugin_app_under_plugin_name(self) -> None:
-        from aegis.__main__ import _mount_plugin_cli_apps
+        from aegis.cli.app import _mount_plugin_cli_apps
 
         fresh_app = typer.Typer(name="aegis")
         plugin_app = typer.Typer()
@@ -354,7 +354,7 @@ class TestMountPluginCliApps:
     def test_passes_existing_command_names_as_reserved(self) -> None:
         """The reserved set passed to discover should include every core
         command + group already registered on the app."""
-        from aegis.__main__ import _mount_plugin_cli_apps
+        from aegis.cli.app import _mount_plugin_cli_apps
 
         fresh_app = typer.Typer(name="aegis")
 
@@ -382,7 +382,7 @@ class TestMountPluginCliApps:
 
     def test_skips_mounting_when_no_plugins(self) -> None:
         """Empty discovery → no groups added; sanity check the no-op path."""
-        from aegis.__main__ import _mount_plugin_cli_apps
+        from aegis.cli.app import _mount_plugin_cli_apps
 
         fresh_app = typer.Typer(name="aegis")
         before = len(fresh_app.registered_groups)
@@ -14,6 +14,7 @@ from aegis.core.services import (
     get_service,
     get_service_dependencies,
     get_services_by_type,
+    group_services_by_type,
     list_available_services,
     validate_service_dependencies,
 )
@@ -298,6 +299,14 @@ class TestServiceRegistryFunctions:
             spec.type == ServiceType.CONTENT for spec in content_services.values()
         )
 
+    def test_group_services_by_type_matches_per_type_lookup(self):
+        """Test one-pass grouping agrees with get_services_by_type."""
+        grouped = group_services_by_type()
+        for service_type in ServiceType:
+            expected = get_services_by_type(service_type)
+            assert grouped.get(service_type, {}) == expected
+            assert list(grouped.get(service_type, {})) == list(expected)
+
     def test_list_available_services(self):
         """Test listing all available services."""
         services = list_available_services()